@@ -13,7 +13,7 @@ import os
 # Allow running from repo root without installing the package
 sys.path.insert(0, os.path.dirname(__file__))
 
-from dt_ppt_builder.builder import build
+from dt_ppt_builder.builder import build, build_and_save, load_requirements
 
 
 def main():
@@ -27,21 +27,18 @@ def main():
         help="Override output path from the config file")
     args = parser.parse_args()
 
-    # Optional output override
+    # Optional output override — patch the parsed config in memory and build
+    # directly (no temp-file round trip, no second YAML parse)
     if args.output:
         import yaml
         with open(args.config, encoding="utf-8") as f:
-            cfg = yaml.safe_load(f)
+            cfg = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         cfg["output"] = args.output
-        # Write a temporary patched config
-        import tempfile, json
-        tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml",
-                                          delete=False, encoding="utf-8")
-        yaml.dump(cfg, tmp, allow_unicode=True)
-        tmp.close()
+        config_dir = os.path.dirname(os.path.abspath(args.config))
+        req_data = load_requirements(cfg, config_dir)
         print(f"[build_deck] Output overridden → {args.output}")
-        build(tmp.name)
-        os.unlink(tmp.name)
+        result = build_and_save(cfg, req_data, args.output)
+        print(f"\n  ✅ Saved: {result}")
     else:
         build(args.config)
 
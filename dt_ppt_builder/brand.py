@@ -1,4 +1,6 @@
 """Dynatrace brand colors and font constants."""
+from functools import lru_cache
+
 from pptx.dml.color import RGBColor
 from pptx.util import Pt
 
@@ -21,8 +23,16 @@ STATUS_COLOR = {
     "\U0001f5fa": GRAY, # 🗺 Roadmap
 }
 
+# Status strings lead with their emoji, so a first-char dispatch avoids
+# substring-scanning every symbol per call
+_SYM_FIRST = {s[0]: c for s, c in STATUS_COLOR.items()}
+
+@lru_cache(maxsize=64)
 def status_color(val: str) -> RGBColor:
-    for sym, color in STATUS_COLOR.items():
+    color = _SYM_FIRST.get(val[:1]) if val else None
+    if color is not None:
+        return color
+    for sym, c in STATUS_COLOR.items():   # emoji not leading — rare
         if sym in val:
-            return color
+            return c
     return WHITE
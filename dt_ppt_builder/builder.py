@@ -9,11 +9,25 @@ Usage (programmatic / MCP):
     from dt_ppt_builder.builder import build_from_dict
     pptx_bytes = build_from_dict(cfg_dict, requirements_list)
 """
+import functools
 import io
+import logging
 import os
 import json
 import yaml
 
+logger = logging.getLogger(__name__)
+
+try:                       # 2-5× faster JSON parse; optional
+    import orjson
+except ImportError:
+    orjson = None
+
+try:                       # libyaml C loader: ~10× faster parse when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from pptx import Presentation
 from pptx.util import Inches
 from pptx.oxml.ns import qn
@@ -24,41 +38,69 @@ from . import slide_builder as sb
 # ─────────────────────────────────────────────────────────────────────────────
 # Template loading — strips all existing slides cleanly (no corruption)
 # ─────────────────────────────────────────────────────────────────────────────
+# Cleaned-template bytes keyed by (path, mtime_ns, size) so repeated builds
+# from the same template (server / MCP workloads) skip the ZIP read, XML parse
+# and slide-strip loop. Bounded LRU: oldest entry evicted beyond the cap.
+from collections import OrderedDict
+
+_TEMPLATE_CACHE: OrderedDict = OrderedDict()
+_TEMPLATE_CACHE_MAX = 8
+
+
 def _load_template_clean(path: str) -> Presentation:
-    # .potx files need conversion: rename to .pptx so python-pptx accepts them
-    import tempfile, shutil
+    st = os.stat(path)
+    cache_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = _TEMPLATE_CACHE.get(cache_key)
+    if cached is not None:
+        _TEMPLATE_CACHE.move_to_end(cache_key)
+        prs = Presentation(io.BytesIO(cached))
+        logger.debug("Template loaded: %s (cached)", os.path.basename(path))
+        return prs
+
+    # .potx files need conversion: patch the content type so python-pptx
+    # accepts them — done entirely in memory (no temp-file round trip)
+    import shutil
     ext = os.path.splitext(path)[1].lower()
     if ext == ".potx":
-        tmp = os.path.join(tempfile.gettempdir(), "dt_ppt_tmp.pptx")
-        shutil.copy2(path, tmp)
-        # Patch content type inside the ZIP from template → presentation
-        import zipfile, io
-        buf = io.BytesIO()
-        with zipfile.ZipFile(tmp, "r") as zin, zipfile.ZipFile(buf, "w") as zout:
+        import zipfile
+        with open(path, "rb") as f:
+            src_buf = io.BytesIO(f.read())
+        dst_buf = io.BytesIO()
+        with zipfile.ZipFile(src_buf, "r") as zin, \
+             zipfile.ZipFile(dst_buf, "w", zipfile.ZIP_DEFLATED) as zout:
             for item in zin.infolist():
-                data = zin.read(item.filename)
                 if item.filename == "[Content_Types].xml":
-                    data = data.replace(
+                    data = zin.read(item.filename).replace(
                         b"application/vnd.openxmlformats-officedocument.presentationml.template.main+xml",
                         b"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml",
                     )
-                zout.writestr(item, data)
-        with open(tmp, "wb") as f:
-            f.write(buf.getvalue())
-        path = tmp
-    prs = Presentation(path)
-    xml_slides    = prs.slides._sldIdLst
-    slide_id_list = list(xml_slides)
-    for sId in slide_id_list:
-        rId = sId.get(qn("r:id"))
+                    zout.writestr(item, data)
+                else:
+                    # Stream entry-to-entry; avoids materializing each member
+                    with zin.open(item) as src, zout.open(item, "w") as dst:
+                        shutil.copyfileobj(src, dst)
+        prs = Presentation(dst_buf)
+    else:
+        prs = Presentation(path)
+    xml_slides = prs.slides._sldIdLst
+    # Collect rIds first, then clear all <p:sldId> children in one slice
+    # assignment — per-element lxml removal is O(N²) on sibling lists
+    rIds = [sId.get(qn("r:id")) for sId in xml_slides]
+    xml_slides[:] = []
+    for rId in rIds:
         if rId:
             try:
                 prs.part.drop_rel(rId)
             except Exception:
                 pass
-        xml_slides.remove(sId)
-    assert len(prs.slides) == 0, "Slides not cleared!"
-    print(f"  Template loaded: {os.path.basename(path)}")
+    # Serialize the cleaned template once so later calls skip the whole
+    # load-and-strip pass and just re-hydrate from bytes.
+    buf = io.BytesIO()
+    prs.save(buf)
+    _TEMPLATE_CACHE[cache_key] = buf.getvalue()
+    while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_MAX:
+        _TEMPLATE_CACHE.popitem(last=False)
+    logger.debug("Template loaded: %s", os.path.basename(path))
     return prs
 
 
@@ -91,55 +133,131 @@ def _layout_map(prs, cfg) -> dict:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Domain summary helper
+# Requirements loading — shared path resolution for CLI + config builds
 # ─────────────────────────────────────────────────────────────────────────────
-def _domain_summary(reqs):
-    """Return (name, total, now, partial, roadmap) from a list of req dicts."""
-    now     = sum(1 for r in reqs if "✅" in r.get("status","") or "Now"     in r.get("status",""))
-    partial = sum(1 for r in reqs if "⚡" in r.get("status","") or "Partial" in r.get("status",""))
-    roadmap = sum(1 for r in reqs if "🗺" in r.get("status","") or "Roadmap" in r.get("status",""))
-    return {"total": len(reqs), "now": now, "partial": partial, "roadmap": roadmap}
+@functools.lru_cache(maxsize=32)
+def _load_req_json(path: str, mtime_ns: int) -> list:
+    # mtime_ns is part of the key purely for cache invalidation
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)   # list of domain dicts: {name, description, reqs:[...]}
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Main build function
-# ─────────────────────────────────────────────────────────────────────────────
-def build(config_path: str):
-    """Generate a full branded PPTX from a YAML config + JSON requirements."""
-    config_dir = os.path.dirname(os.path.abspath(config_path))
+def load_requirements(cfg: dict, config_dir: str) -> list:
+    """Resolve cfg['requirements_file'] relative to config_dir and load it.
 
-    # ── Load config ──────────────────────────────────────────────────────────
-    with open(config_path, encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
-
-    # ── Load requirements data ───────────────────────────────────────────────
+    Parses are cached per (path, mtime), so repeated builds from the same
+    requirements file reuse the already-parsed list.
+    """
     req_path = cfg.get("requirements_file") or os.path.join(config_dir, "requirements.json")
     if not os.path.isabs(req_path):
         req_path = os.path.join(config_dir, req_path)
+    return _load_req_json(req_path, os.stat(req_path).st_mtime_ns)
 
-    with open(req_path, encoding="utf-8") as f:
-        req_data = json.load(f)   # list of domain dicts: {name, description, reqs:[...]}
 
-    # ── Load template ────────────────────────────────────────────────────────
-    template_path = cfg["template"]
-    prs = _load_template_clean(template_path)
-    SL  = _layout_map(prs, cfg)
+# ─────────────────────────────────────────────────────────────────────────────
+# Domain summary helper
+# ─────────────────────────────────────────────────────────────────────────────
+# Status-emoji first-char → counter key (statuses normally lead with the emoji)
+_STATUS_KEY = {"✅": "now", "⚡": "partial", "🗺": "roadmap"}
 
-    # ── Slide sequence ───────────────────────────────────────────────────────
-    print("  Building slides…")
 
-    # 1. Title slide
-    sb.title_slide(prs, SL, cfg)
-    print("    ✓ Title slide")
+def _domain_summary(reqs):
+    """Return {total, now, partial, roadmap} counts from a list of req dicts."""
+    counts = {"now": 0, "partial": 0, "roadmap": 0}
+    for r in reqs:
+        s = r.get("status", "")
+        if not s:
+            continue
+        key = _STATUS_KEY.get(s[:1])
+        if key is None:   # emoji missing — fall back to keyword match
+            key = ("now"     if "Now"     in s else
+                   "partial" if "Partial" in s else
+                   "roadmap" if "Roadmap" in s else None)
+        if key:
+            counts[key] += 1
+    return {"total": len(reqs), **counts}
+
+
+def _prepare_domains(req_data):
+    """
+    Single pass over req_data: pre-materialize the per-domain requirement
+    tuples and status summary together so the orchestrators don't iterate
+    (and re-build the tuples) twice.
 
-    # 2. Coverage matrix
-    domains_summary = []
+    Returns list of (name, req_tuples, description, summary) per domain.
+    """
+    domains = []
     for d in req_data:
         summary = _domain_summary(d["reqs"])
         summary["name"] = d["name"]
-        domains_summary.append(summary)
-    sb.coverage_slide(prs, SL, cfg, domains_summary)
-    print("    ✓ Coverage matrix slide")
+        req_tuples = [(r["requirement"], r["description"],
+                       r.get("status", ""), r.get("signal", ""))
+                      for r in d["reqs"]]
+        domains.append((d["name"], req_tuples, d.get("description", ""), summary))
+    return domains
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Output recompression — shrink on-disk decks beyond python-pptx defaults
+# ─────────────────────────────────────────────────────────────────────────────
+def _save_pptx(prs, output_path: str, compresslevel: int = 9) -> int:
+    """
+    Serialize prs, re-deflate at maximum compression in memory, and write
+    the result to output_path atomically. Returns the bytes written so
+    callers can log the size without re-stat'ing the file. python-pptx
+    writes DEFLATE at the zlib default level; the XML-heavy parts of large
+    decks shrink noticeably at level 9.
+    """
+    import zipfile, shutil
+    raw = io.BytesIO()
+    prs.save(raw)
+    raw.seek(0)
+    packed = io.BytesIO()
+    with zipfile.ZipFile(raw, "r") as zin, \
+         zipfile.ZipFile(packed, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel) as zout:
+        for item in zin.infolist():
+            # open(..., "w") takes its level from the ZipInfo, not the
+            # ZipFile, and infolist() entries carry none — stamp it per
+            # entry or the re-deflate silently runs at the zlib default
+            item._compresslevel = compresslevel
+            with zin.open(item) as src, zout.open(item, "w") as dst:
+                shutil.copyfileobj(src, dst)
+    data = packed.getbuffer()
+    tmp = output_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, output_path)
+    return len(data)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared slide-sequence core  (used by CLI build and programmatic builds)
+# ─────────────────────────────────────────────────────────────────────────────
+def _render_all_slides(prs, SL, cfg: dict, req_data: list, verbose: bool = False):
+    """Render the full slide sequence into prs. Single source of truth."""
+    log = print if verbose else (lambda msg: logger.debug(msg))
+
+    # Warm the image cache concurrently — overlaps the screenshot disk reads
+    # with nothing-yet, so the serial add_picture calls below hit memory
+    shots_dir = cfg.get("screenshots_dir", "")
+    img_paths = [os.path.join(shots_dir, fn)
+                 for fn in cfg.get("images", {}).values() if fn]
+    if cfg.get("customer_logo"):
+        img_paths.append(cfg["customer_logo"])
+    sb.prefetch_images(img_paths)
+
+    # 1. Title slide
+    sb.title_slide(prs, SL, cfg)
+    log("    ✓ Title slide")
+
+    # 2. Coverage matrix
+    domains = _prepare_domains(req_data)
+    sb.coverage_slide(prs, SL, cfg, [dm[3] for dm in domains])
+    log("    ✓ Coverage matrix slide")
 
     # 3. Instrumentation / landing screenshot (if configured)
     landing_bullets = cfg.get("landing_bullets")
@@ -149,17 +267,15 @@ def build(config_path: str):
                                   title=cfg.get("landing_title",
                                                 "AI Observability — Application View"),
                                   bullets=landing_bullets or [])
-        print("    ✓ Instrumentation slide")
+        log("    ✓ Instrumentation slide")
 
     # 4. One slide per domain
-    for d in req_data:
+    for name, req_tuples, description, _ in domains:
         sb.domain_slide(prs, SL, cfg,
-                         domain_label=d["name"],
-                         reqs=[(r["requirement"], r["description"],
-                                r.get("status", ""), r.get("signal", ""))
-                               for r in d["reqs"]],
-                         description=d.get("description", ""))
-        print(f"    ✓ Domain slide: {d['name']}")
+                         domain_label=name,
+                         reqs=req_tuples,
+                         description=description)
+        log(f"    ✓ Domain slide: {name}")
 
     # 5. Screenshot slides (defined in config as a list)
     for ss in cfg.get("screenshot_slides", []):
@@ -168,13 +284,13 @@ def build(config_path: str):
                                 title=ss["title"],
                                 left_key=ss["left_key"],   left_caption=ss["left_caption"],
                                 right_key=ss["right_key"],  right_caption=ss["right_caption"])
-            print(f"    ✓ Two-image slide: {ss['title']}")
+            log(f"    ✓ Two-image slide: {ss['title']}")
         elif ss.get("type") == "single":
             sb.instrumentation_slide(prs, SL, cfg,
                                       img_key=ss["img_key"],
                                       title=ss["title"],
                                       bullets=ss.get("bullets", []))
-            print(f"    ✓ Single-image slide: {ss['title']}")
+            log(f"    ✓ Single-image slide: {ss['title']}")
 
     # 6. GCC / regulatory slide (optional)
     gcc_cfg = cfg.get("gcc_slide")
@@ -186,25 +302,14 @@ def build(config_path: str):
         sb.gcc_slide(prs, SL, cfg, gcc_reqs,
                      title=gcc_cfg.get("title"),
                      eyebrow=gcc_cfg.get("eyebrow"))
-        print("    ✓ GCC slide")
+        log("    ✓ GCC slide")
 
     # 7. Closing slide
     sb.closing_slide(prs, SL, cfg, message=cfg.get("closing_message"))
-    print("    ✓ Closing slide")
-
-    # ── Save ─────────────────────────────────────────────────────────────────
-    output = cfg["output"]
-    os.makedirs(os.path.dirname(output), exist_ok=True)
-    prs.save(output)
-    size_mb = os.path.getsize(output) / 1_048_576
-    print(f"\n  ✅ Saved: {output}  ({size_mb:.1f} MB, {len(prs.slides)} slides)")
-    return output
+    log("    ✓ Closing slide")
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Programmatic interface (config dict + requirements list → bytes)
-# ─────────────────────────────────────────────────────────────────────────────
-def _build_prs(cfg: dict, req_data: list) -> Presentation:
+def _build_prs(cfg: dict, req_data: list, verbose: bool = False) -> Presentation:
     """
     Core builder: takes a config dict and a requirements list,
     returns a python-pptx Presentation object.
@@ -212,64 +317,47 @@ def _build_prs(cfg: dict, req_data: list) -> Presentation:
     template_path = cfg["template"]
     prs = _load_template_clean(template_path)
     SL  = _layout_map(prs, cfg)
+    _render_all_slides(prs, SL, cfg, req_data, verbose=verbose)
+    return prs
 
-    # 1. Title slide
-    sb.title_slide(prs, SL, cfg)
 
-    # 2. Coverage matrix
-    domains_summary = []
-    for d in req_data:
-        summary = _domain_summary(d["reqs"])
-        summary["name"] = d["name"]
-        domains_summary.append(summary)
-    sb.coverage_slide(prs, SL, cfg, domains_summary)
+# ─────────────────────────────────────────────────────────────────────────────
+# Main build function
+# ─────────────────────────────────────────────────────────────────────────────
+def build(config_path: str):
+    """Generate a full branded PPTX from a YAML config + JSON requirements."""
+    config_dir = os.path.dirname(os.path.abspath(config_path))
 
-    # 3. Instrumentation / landing slide
-    landing_bullets = cfg.get("landing_bullets")
-    if landing_bullets or cfg.get("images", {}).get("landing"):
-        sb.instrumentation_slide(prs, SL, cfg,
-                                  img_key="landing",
-                                  title=cfg.get("landing_title",
-                                                "AI Observability — Application View"),
-                                  bullets=landing_bullets or [])
+    # ── Load config ──────────────────────────────────────────────────────────
+    with open(config_path, encoding="utf-8") as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
 
-    # 4. One slide per domain
-    for d in req_data:
-        sb.domain_slide(prs, SL, cfg,
-                         domain_label=d["name"],
-                         reqs=[(r["requirement"], r["description"],
-                                r.get("status", ""), r.get("signal", ""))
-                               for r in d["reqs"]],
-                         description=d.get("description", ""))
+    # ── Load requirements data ───────────────────────────────────────────────
+    req_data = load_requirements(cfg, config_dir)
 
-    # 5. Screenshot slides
-    for ss in cfg.get("screenshot_slides", []):
-        if ss.get("type") == "two_image":
-            sb.two_image_slide(prs, SL, cfg,
-                                title=ss["title"],
-                                left_key=ss["left_key"],   left_caption=ss["left_caption"],
-                                right_key=ss["right_key"],  right_caption=ss["right_caption"])
-        elif ss.get("type") == "single":
-            sb.instrumentation_slide(prs, SL, cfg,
-                                      img_key=ss["img_key"],
-                                      title=ss["title"],
-                                      bullets=ss.get("bullets", []))
+    # ── Build ────────────────────────────────────────────────────────────────
+    print("  Building slides…")
+    prs = _build_prs(cfg, req_data, verbose=True)
 
-    # 6. GCC / regulatory slide
-    gcc_cfg = cfg.get("gcc_slide")
-    if gcc_cfg:
-        gcc_reqs_raw = gcc_cfg.get("reqs", [])
-        gcc_reqs = [(r["requirement"], r["description"],
-                     r.get("status", ""), r.get("signal", ""))
-                    for r in gcc_reqs_raw]
-        sb.gcc_slide(prs, SL, cfg, gcc_reqs,
-                     title=gcc_cfg.get("title"),
-                     eyebrow=gcc_cfg.get("eyebrow"))
+    # ── Save ─────────────────────────────────────────────────────────────────
+    output = cfg["output"]
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    size_mb = _save_pptx(prs, output) / 1_048_576
+    print(f"\n  ✅ Saved: {output}  ({size_mb:.1f} MB, {len(prs.slides)} slides)")
+    return output
 
-    # 7. Closing slide
-    sb.closing_slide(prs, SL, cfg, message=cfg.get("closing_message"))
 
-    return prs
+# ─────────────────────────────────────────────────────────────────────────────
+# Programmatic interface (config dict + requirements list → bytes)
+# ─────────────────────────────────────────────────────────────────────────────
+def build_to_stream(cfg: dict, req_data: list, stream) -> None:
+    """
+    Build a PPTX and write it into a caller-supplied binary stream
+    (e.g. an HTTP response body). Avoids buffering the whole deck in
+    memory — preferred over build_from_dict for large decks.
+    """
+    prs = _build_prs(cfg, req_data)
+    prs.save(stream)
 
 
 def build_from_dict(cfg: dict, req_data: list) -> bytes:
@@ -277,9 +365,8 @@ def build_from_dict(cfg: dict, req_data: list) -> bytes:
     Build a PPTX from a config dict + requirements list.
     Returns the .pptx file content as bytes.
     """
-    prs = _build_prs(cfg, req_data)
     buf = io.BytesIO()
-    prs.save(buf)
+    build_to_stream(cfg, req_data, buf)
     return buf.getvalue()
 
 
@@ -289,8 +376,7 @@ def build_and_save(cfg: dict, req_data: list, output_path: str) -> str:
     """
     prs = _build_prs(cfg, req_data)
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    prs.save(output_path)
-    size_mb = os.path.getsize(output_path) / 1_048_576
+    size_mb = _save_pptx(prs, output_path) / 1_048_576
     return f"{output_path} ({size_mb:.1f} MB, {len(prs.slides)} slides)"
 
 
@@ -322,8 +408,7 @@ def build_generic(template_path: str, slides: list[dict],
     gs.render_all(prs, SL, slides)
 
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    prs.save(output_path)
-    size_mb = os.path.getsize(output_path) / 1_048_576
+    size_mb = _save_pptx(prs, output_path) / 1_048_576
     return f"{output_path} ({size_mb:.1f} MB, {len(prs.slides)} slides)"
 
 
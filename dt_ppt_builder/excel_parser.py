@@ -22,8 +22,20 @@ Supports two common formats:
 """
 import json
 import os
+import re
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import orjson           # 2-5× faster JSON serialization; optional
+except ImportError:
+    orjson = None
+
+try:
+    from python_calamine import CalamineWorkbook  # Rust-backed, much faster
+except ImportError:
+    CalamineWorkbook = None  # Handled at call time
+
 try:
     import openpyxl
 except ImportError:
@@ -41,42 +53,45 @@ _ALIASES = {
     "domain":      ["domain", "domain name", "category", "group", "area"],
 }
 
+# Inverted at import time → O(1) per header cell
+_ALIAS_TO_KEY = {a: k for k, al in _ALIASES.items() for a in al}
+
 
 def _match_col(header: str) -> Optional[str]:
     """Map a raw column header to a canonical key, or None."""
-    h = header.strip().lower()
-    for key, aliases in _ALIASES.items():
-        if h in aliases:
-            return key
-    return None
+    return _ALIAS_TO_KEY.get(header.strip().lower())
+
+
+# One C-level scan instead of up to 7 substring tests per status value.
+# Rank preserves the historical precedence: now-family > partial > roadmap.
+_STATUS_RE   = re.compile(r"now|available|yes|partial|roadmap|planned|future", re.I)
+_STATUS_SYM  = {"now": "✅", "available": "✅", "yes": "✅", "partial": "⚡",
+                "roadmap": "🗺", "planned": "🗺", "future": "🗺"}
+_STATUS_RANK = {"✅": 0, "⚡": 1, "🗺": 2}
 
 
 def _normalise_status(val: str) -> str:
     """Ensure status values include the standard emoji prefixes."""
     v = val.strip()
-    lo = v.lower()
-    if "now" in lo or "available" in lo or "yes" in lo:
-        return f"✅ {v}" if "✅" not in v else v
-    if "partial" in lo:
-        return f"⚡ {v}" if "⚡" not in v else v
-    if "roadmap" in lo or "planned" in lo or "future" in lo:
-        return f"🗺 {v}" if "🗺" not in v else v
-    return v
+    matches = _STATUS_RE.findall(v)
+    if not matches:
+        return v
+    sym = min((_STATUS_SYM[m.lower()] for m in matches),
+              key=_STATUS_RANK.__getitem__)
+    return v if sym in v else f"{sym} {v}"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Parse a single sheet into a list of requirement dicts
 # ─────────────────────────────────────────────────────────────────────────────
-def _parse_sheet(ws) -> list[dict]:
-    """Read requirement rows from a worksheet. Returns list of req dicts."""
-    rows = list(ws.iter_rows(values_only=True))
-    if not rows:
-        return []
-
-    # Find header row (first row with ≥2 recognised columns)
-    header_idx = None
+def _parse_sheet(rows) -> list[dict]:
+    """Read requirement rows (iterable of cell tuples). Returns list of req dicts."""
+    it = iter(rows)
+
+    # Phase 1: find header row (first row with ≥2 recognised columns),
+    # streaming — no need to materialize everything above the header
     col_map = {}
-    for i, row in enumerate(rows):
+    for row in it:
         mapping = {}
         for c, cell_val in enumerate(row):
             if cell_val is None:
@@ -85,37 +100,64 @@ def _parse_sheet(ws) -> list[dict]:
             if key:
                 mapping[key] = c
         if len(mapping) >= 2:
-            header_idx = i
             col_map = mapping
             break
+    else:
+        return []   # no header found (or empty sheet)
 
-    if header_idx is None:
-        return []
+    # Phase 2: remaining rows of the same iterator are the data rows.
+    # Hoist column indices to locals — avoids repeated dict lookups per row.
+    ri  = col_map.get("requirement")
+    di  = col_map.get("description")
+    si  = col_map.get("status")
+    gi  = col_map.get("signal")
+    dmi = col_map.get("domain")
 
     reqs = []
-    for row in rows[header_idx + 1:]:
-        req_name = row[col_map["requirement"]] if "requirement" in col_map else None
+    ncols = max(col_map.values()) + 1
+    for row in it:
+        if len(row) < ncols:   # calamine may trim trailing empty cells
+            row = tuple(row) + (None,) * (ncols - len(row))
+        req_name = row[ri] if ri is not None else None
         if not req_name or str(req_name).strip() == "":
             continue
+        desc = row[di] if di is not None else None
+        st   = row[si] if si is not None else None
+        sig  = row[gi] if gi is not None else None
         r = {
             "requirement": str(req_name).strip(),
-            "description": str(row[col_map["description"]]).strip()
-                            if "description" in col_map and row[col_map["description"]]
-                            else "",
-            "status": _normalise_status(str(row[col_map["status"]]).strip())
-                      if "status" in col_map and row[col_map["status"]]
-                      else "",
-            "signal": str(row[col_map["signal"]]).strip()
-                      if "signal" in col_map and row[col_map["signal"]]
-                      else "",
+            "description": str(desc).strip() if desc else "",
+            "status": _normalise_status(str(st).strip()) if st else "",
+            "signal": str(sig).strip() if sig else "",
         }
         # Carry domain column for single-sheet grouping
-        if "domain" in col_map and row[col_map["domain"]]:
-            r["_domain"] = str(row[col_map["domain"]]).strip()
+        if dmi is not None and row[dmi]:
+            r["_domain"] = str(row[dmi]).strip()
         reqs.append(r)
     return reqs
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Workbook readers — calamine (Rust) when available, openpyxl fallback
+# ─────────────────────────────────────────────────────────────────────────────
+def _sheet_rows(path: str):
+    """Yield (sheet_name, rows) per sheet. rows is a sequence of cell tuples."""
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        for name in wb.sheet_names:
+            yield name, wb.get_sheet_by_name(name).to_python()
+        return
+    if openpyxl is None:
+        raise ImportError(
+            "python-calamine or openpyxl is required: pip install python-calamine")
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        for name in wb.sheetnames:
+            yield name, wb[name].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────────────────────────────────────
@@ -123,26 +165,27 @@ def parse_excel(path: str) -> list[dict]:
     """
     Parse an Excel workbook into the canonical requirements JSON structure.
 
+    Results are cached per (path, mtime) — repeated calls on an unchanged
+    workbook (e.g. from an MCP server) skip the parse entirely.
+
     Returns:
         list of domain dicts:  [{name, description, reqs: [...]}]
     """
-    if openpyxl is None:
-        raise ImportError("openpyxl is required: pip install openpyxl")
+    return _parse_excel_cached(path, os.stat(path).st_mtime_ns)
 
-    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
-    sheets = wb.sheetnames
 
+@lru_cache(maxsize=32)
+def _parse_excel_cached(path: str, mtime_ns: int) -> list[dict]:
     # Strategy 1: multi-sheet (skip sheets that look like metadata)
     skip = {"summary", "overview", "metadata", "readme", "instructions", "cover"}
-    domain_sheets = [s for s in sheets if s.strip().lower() not in skip]
 
     all_reqs = []
-    for sheet_name in domain_sheets:
-        ws = wb[sheet_name]
-        reqs = _parse_sheet(ws)
+    for sheet_name, rows in _sheet_rows(path):
+        if sheet_name.strip().lower() in skip:
+            continue
+        reqs = _parse_sheet(rows)
         if reqs:
             all_reqs.append((sheet_name, reqs))
-    wb.close()
 
     if not all_reqs:
         raise ValueError(f"No valid requirement rows found in {path}")
@@ -187,7 +230,10 @@ def parse_excel_to_json(excel_path: str, output_path: str = None) -> str:
     Returns the JSON string.
     """
     data = parse_excel(excel_path)
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        json_str = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    else:
+        json_str = json.dumps(data, indent=2, ensure_ascii=False)
     if output_path:
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
         with open(output_path, "w", encoding="utf-8") as f:
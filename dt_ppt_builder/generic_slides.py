@@ -22,34 +22,111 @@ Supported slide types:
   two_image   —  Two screenshots side-by-side with captions
   value_props —  Stacked value proposition items (icon + bold title + description)
 """
+from functools import lru_cache
+from itertools import cycle, islice
+
+from lxml import etree
+from pptx.oxml.ns import qn
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
+from xml.sax import saxutils
+import io
 import os
+import sys
+import types
 
 from .brand import WHITE, TEAL, GREEN, ORANGE, GRAY, DGRAY, DDGRAY, DTDARK, RGBColor
-from .helpers import set_ph, txb, para_block
+from .helpers import (set_ph, txb, txb_styled, para_block_xml,
+                      _forget_file, _image_bytes, _is_file, _prepare_image)
+
+
+# Cached EMU conversions — renderers reuse the same handful of literal
+# positions on every slide, so each Inches()/Pt() allocation is redundant.
+# Rounding keeps accumulated float coordinates (x + 0.2, …) on the hit path.
+@lru_cache(maxsize=256)
+def _IN(x):
+    return Inches(round(x, 3))
+
+
+@lru_cache(maxsize=64)
+def _PT(x):
+    return Pt(x)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 def _new(prs, SL, key):
+    # SL already maps names to resolved SlideLayout parts (built once per
+    # build in _layout_map), so this is a single dict lookup — no per-slide
+    # relationship walking happens here.
     return prs.slides.add_slide(SL[key])
 
 
-# Map user-friendly color names → RGBColor
+# Map user-friendly color names → RGBColor. The lower/Title/UPPER variants
+# are pre-populated so lookups skip the per-call .lower()
 _NAMED_COLORS = {
-    "white": WHITE, "teal": TEAL, "green": GREEN,
-    "orange": ORANGE, "gray": GRAY,
+    variant: color
+    for name, color in (("white", WHITE), ("teal", TEAL), ("green", GREEN),
+                        ("orange", ORANGE), ("gray", GRAY))
+    for variant in (name, name.title(), name.upper())
 }
 
+# Shape-type enums resolved once — add_shape call sites skip the IntEnum
+# attribute walk per shape
+_RECT = MSO_SHAPE.RECTANGLE
+_ROUND = MSO_SHAPE.ROUNDED_RECTANGLE
+
+# Fixed call-site text styles, converted once: (size_pt, bold, color, align).
+# Consumed by helpers.txb_styled, which skips per-call kwargs and Pt() work.
+_STYLE_BRAND    = (_PT(16), False, WHITE, None)
+_STYLE_HERO     = (_PT(44), True,  WHITE, None)
+_STYLE_HERO_SUB = (_PT(28), False, WHITE, None)
+_STYLE_TAGLINE  = (_PT(14), False, GRAY,  None)
+_STYLE_CTA      = (_PT(32), True,  WHITE, None)
+_STYLE_FOOTER   = (_PT(8),  False, GRAY,  None)
+
+
+def _footer(sl, text):
+    """Shared footer strip — same geometry/style on every renderer."""
+    if text:
+        txb_styled(sl, text, 0.5, 5.25, 9.0, 0.3, _STYLE_FOOTER)
+
+
+def _brand(sl, text):
+    """Brand wordmark, top-left (hero / cta slides)."""
+    txb_styled(sl, text, 0.6, 0.4, 3.0, 0.5, _STYLE_BRAND)
+
+
+def _maybe_ph(sl, idx, text, **kw):
+    """set_ph only when there is text — skips the placeholder write (and
+    its lxml churn) for the empty fields most specs carry."""
+    if text:
+        set_ph(sl, idx, text, **kw)
+
+
+def _pic(sl, path, x, y, w, h):
+    """add_picture via the shared byte/variant caches: one read + one
+    re-encode per distinct image no matter how often it recurs."""
+    try:
+        data = _prepare_image(_image_bytes(path))
+    except OSError:   # cached positive gone stale — warn-and-skip
+        _forget_file(path)
+        print(f"  [WARN] image not found: {path}")
+        return None
+    return sl.shapes.add_picture(io.BytesIO(data),
+                                 _IN(x), _IN(y), _IN(w), _IN(h))
+
+
+@lru_cache(maxsize=32)
 def _resolve_color(val, default=WHITE):
-    if val is None:
+    if not isinstance(val, str):
         return default
-    if isinstance(val, str):
-        return _NAMED_COLORS.get(val.lower(), default)
-    return default
+    hit = _NAMED_COLORS.get(val)
+    if hit is not None:
+        return hit
+    return _NAMED_COLORS.get(val.lower(), default)   # mIxEd case — rare
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -57,10 +134,10 @@ def _resolve_color(val, default=WHITE):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_title(prs, SL, spec):
     sl = _new(prs, SL, "title_center")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=36, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-    set_ph(sl, 1, spec.get("subtitle", ""),
-           size=20, color=TEAL, align=PP_ALIGN.CENTER)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=36, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    _maybe_ph(sl, 1, spec.get("subtitle"),
+              size=20, color=TEAL, align=PP_ALIGN.CENTER)
     contact = spec.get("contact", "")
     if contact:
         txb(sl, contact, 3.5, 5.6, 7.0, 0.5,
@@ -73,11 +150,10 @@ def render_title(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_section(prs, SL, spec):
     sl = _new(prs, SL, "title_center")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=30, bold=True, color=TEAL, align=PP_ALIGN.CENTER)
-    sub = spec.get("subtitle", "")
-    if sub:
-        set_ph(sl, 1, sub, size=14, color=WHITE, align=PP_ALIGN.CENTER)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=30, bold=True, color=TEAL, align=PP_ALIGN.CENTER)
+    _maybe_ph(sl, 1, spec.get("subtitle"),
+              size=14, color=WHITE, align=PP_ALIGN.CENTER)
     return sl
 
 
@@ -86,26 +162,42 @@ def render_section(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_bullets(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
     bullets = spec.get("bullets", [])
-    para_block(sl, bullets, 0.7, 2.0, 11.5, 5.2, size=12, color=WHITE)
+    para_block_xml(sl, bullets, 0.7, 2.0, 11.5, 5.2, size=12, color=WHITE)
     return sl
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. Table slide
 # ─────────────────────────────────────────────────────────────────────────────
+# Per-cell python-pptx property writes walk descriptor chains and mutate the
+# lxml tree one attribute at a time (~600 writes for a 20×6 table). Instead,
+# each <a:tr> is composed as one XML string and parsed in a single call.
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+_TC_XML = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>'
+    '<a:p>{ppr}<a:r><a:rPr lang="en-US" sz="{sz}"{b}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></a:txBody>'
+    '<a:tcPr><a:solidFill><a:srgbClr val="{bg}"/></a:solidFill></a:tcPr></a:tc>'
+)
+
+# Hex forms of the table palette, converted once instead of per cell
+_TEAL_HEX, _WHITE_HEX = str(TEAL), str(WHITE)
+_DGRAY_HEX, _DDGRAY_HEX, _DTDARK_HEX = str(DGRAY), str(DDGRAY), str(DTDARK)
+# Zebra striping indexed by ri & 1 instead of a per-row branch
+_ROW_BG_HEX = (_DGRAY_HEX, _DDGRAY_HEX)
+
+
 def render_table(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
 
     columns = spec.get("columns", [])
     rows    = spec.get("rows", [])
@@ -118,30 +210,39 @@ def render_table(prs, SL, spec):
 
     tbl_shape = sl.shapes.add_table(
         n_rows + 1, n_cols,
-        Inches(0.7), Inches(2.2), Inches(12.0), Inches(5.0))
-    tbl = tbl_shape.table
-
-    for c in range(n_cols):
-        tbl.columns[c].width = Inches(col_w)
-
-    # Header
-    for c, h_txt in enumerate(columns):
-        cell = tbl.cell(0, c)
-        p = cell.text_frame.paragraphs[0]
-        p.alignment = PP_ALIGN.CENTER
-        r = p.add_run(); r.text = str(h_txt)
-        r.font.size = Pt(10); r.font.bold = True; r.font.color.rgb = TEAL
-        cell.fill.solid(); cell.fill.fore_color.rgb = DTDARK
-
-    # Data
+        _IN(0.7), _IN(2.2), _IN(12.0), _IN(5.0))
+    tbl_el = tbl_shape.table._tbl
+
+    # Column widths: one pass over the grid XML
+    w_emu = str(int(_IN(col_w)))
+    for gc in tbl_el.find(qn("a:tblGrid")).findall(qn("a:gridCol")):
+        gc.set("w", w_emu)
+
+    trs = tbl_el.findall(qn("a:tr"))
+    esc = saxutils.escape
+
+    # Header row
+    hdr_cells = "".join(
+        _TC_XML.format(ppr='<a:pPr algn="ctr"/>', sz=1000, b=' b="1"',
+                       color=_TEAL_HEX, text=esc(str(h_txt)), bg=_DTDARK_HEX)
+        for h_txt in columns)
+    new_rows = [f'<a:tr xmlns:a="{_A_NS}" h="{trs[0].get("h")}">{hdr_cells}</a:tr>']
+
+    # Data rows
     for ri, row in enumerate(rows):
-        bg = DGRAY if ri % 2 == 0 else DDGRAY
-        for c in range(min(n_cols, len(row))):
-            cell = tbl.cell(ri + 1, c)
-            p = cell.text_frame.paragraphs[0]
-            r = p.add_run(); r.text = str(row[c])
-            r.font.size = Pt(9); r.font.color.rgb = WHITE
-            cell.fill.solid(); cell.fill.fore_color.rgb = bg
+        bg = _ROW_BG_HEX[ri & 1]
+        cells = "".join(
+            _TC_XML.format(ppr="", sz=900, b="", color=_WHITE_HEX,
+                           text=esc(str(row[c])) if c < len(row) else "", bg=bg)
+            for c in range(n_cols))
+        new_rows.append(
+            f'<a:tr xmlns:a="{_A_NS}" h="{trs[ri + 1].get("h")}">{cells}</a:tr>')
+
+    # Swap the auto-generated rows for the composed ones
+    for tr in trs:
+        tbl_el.remove(tr)
+    for row_xml in new_rows:
+        tbl_el.append(etree.fromstring(row_xml))
     return sl
 
 
@@ -150,23 +251,23 @@ def render_table(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_two_column(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
 
     # Left column
     left_hdr     = spec.get("left_header", "")
     left_bullets = spec.get("left_bullets", [])
-    para_block(sl, left_bullets, 0.5, 2.2, 5.8, 4.8,
-               size=11, color=WHITE, hdr=left_hdr, hdr_color=TEAL, hdr_size=13)
+    para_block_xml(sl, left_bullets, 0.5, 2.2, 5.8, 4.8,
+                   size=11, color=WHITE, hdr=left_hdr, hdr_color=TEAL,
+                   hdr_size=13)
 
     # Right column
     right_hdr     = spec.get("right_header", "")
     right_bullets = spec.get("right_bullets", [])
-    para_block(sl, right_bullets, 6.8, 2.2, 5.8, 4.8,
-               size=11, color=WHITE, hdr=right_hdr, hdr_color=TEAL, hdr_size=13)
+    para_block_xml(sl, right_bullets, 6.8, 2.2, 5.8, 4.8,
+                   size=11, color=WHITE, hdr=right_hdr, hdr_color=TEAL,
+                   hdr_size=13)
     return sl
 
 
@@ -175,11 +276,9 @@ def render_two_column(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_text(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
     body = spec.get("body", "")
     txb(sl, body, 0.7, 2.0, 11.5, 5.2, size=12, color=WHITE)
     return sl
@@ -189,15 +288,13 @@ def render_text(prs, SL, spec):
 # 7. Image slide
 # ─────────────────────────────────────────────────────────────────────────────
 def render_image(prs, SL, spec):
-    import os
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
     img_path = spec.get("image_path", "")
     caption  = spec.get("caption", "")
-    if img_path and os.path.exists(img_path):
-        sl.shapes.add_picture(img_path,
-                              Inches(1.5), Inches(1.8), Inches(10.0), Inches(5.0))
+    if _is_file(img_path):
+        _pic(sl, img_path, 1.5, 1.8, 10.0, 5.0)
     if caption:
         txb(sl, caption, 1.5, 6.9, 10.0, 0.4,
             size=9, color=GRAY, align=PP_ALIGN.CENTER)
@@ -209,18 +306,22 @@ def render_image(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_comparison(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
 
     items = spec.get("items", [])  # list of {label, bullets}
     n = len(items) or 1
     col_w = 12.0 / n
     for i, item in enumerate(items):
+        bullets = item.get("bullets", [])
+        label   = item.get("label", "")
+        if not bullets and not label:
+            continue
         x = 0.5 + i * col_w
-        para_block(sl, item.get("bullets", []),
-                   x, 2.2, col_w - 0.3, 4.8,
-                   size=11, color=WHITE,
-                   hdr=item.get("label", ""), hdr_color=TEAL, hdr_size=13)
+        para_block_xml(sl, bullets,
+                       x, 2.2, col_w - 0.3, 4.8,
+                       size=11, color=WHITE,
+                       hdr=label, hdr_color=TEAL, hdr_size=13)
     return sl
 
 
@@ -229,8 +330,8 @@ def render_comparison(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_closing(prs, SL, spec):
     sl = _new(prs, SL, "title_center")
-    set_ph(sl, 0, spec.get("message", "Thank you"),
-           size=36, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    _maybe_ph(sl, 0, spec.get("message", "Thank you"),
+              size=36, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
     contact = spec.get("contact", "")
     if contact:
         txb(sl, contact, 3.5, 5.6, 7.0, 0.5,
@@ -245,65 +346,115 @@ def render_closing(prs, SL, spec):
 def render_hero(prs, SL, spec):
     sl = _new(prs, SL, "title_center")
     # Brand word
-    brand = spec.get("brand", "dynatrace")
-    txb(sl, brand, 0.6, 0.4, 3.0, 0.5, size=16, bold=False, color=WHITE)
+    _brand(sl, spec.get("brand", "dynatrace"))
     # Main headline
-    txb(sl, spec.get("headline", ""), 0.6, 1.8, 6.0, 1.2,
-        size=44, bold=True, color=WHITE)
+    txb_styled(sl, spec.get("headline", ""), 0.6, 1.8, 6.0, 1.2, _STYLE_HERO)
     # Sub-headline
     sub = spec.get("sub_headline", "")
     if sub:
-        txb(sl, sub, 0.6, 2.85, 6.0, 0.8,
-            size=28, bold=False, color=WHITE)
+        txb_styled(sl, sub, 0.6, 2.85, 6.0, 0.8, _STYLE_HERO_SUB)
     # Tagline
     tag = spec.get("tagline", "")
     if tag:
-        txb(sl, tag, 0.6, 3.8, 6.0, 0.8,
-            size=14, color=GRAY)
+        txb_styled(sl, tag, 0.6, 3.8, 6.0, 0.8, _STYLE_TAGLINE)
     # Footer
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# SoA textbox batching — renderers that emit many small textboxes per slide
+# (card grids, value props) queue (geom, style, text) tuples while laying
+# out, then flush them as one composed XML fragment parsed in a single
+# lxml call instead of one add_textbox subtree per text.
+# ─────────────────────────────────────────────────────────────────────────────
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+_SP_TEXTBOX_XML = (
+    '<p:sp>'
+    '<p:nvSpPr><p:cNvPr id="{sid}" name="TextBox {sid}"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p>{ppr}<a:r><a:rPr lang="en-US" sz="{sz}"{b}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>'
+)
+
+
+class _TextOps:
+    """Queued one-run textboxes for a slide, flushed in one lxml parse."""
+    __slots__ = ("ops",)
+
+    def __init__(self):
+        self.ops = []
+
+    def add(self, x, y, w, h, text, size, bold=False, color=WHITE, align=None):
+        self.ops.append((x, y, w, h, text, size, bold, color, align))
+
+    def flush(self, sl):
+        if not self.ops:
+            return
+        esc = saxutils.escape
+        sid = sl.shapes._next_shape_id
+        sps = [
+            _SP_TEXTBOX_XML.format(
+                sid=sid + i,
+                x=int(_IN(x)), y=int(_IN(y)), cx=int(_IN(w)), cy=int(_IN(h)),
+                ppr='<a:pPr algn="ctr"/>' if align == PP_ALIGN.CENTER else "",
+                sz=size * 100, b=' b="1"' if bold else "",
+                color=color, text=esc(str(text)))
+            for i, (x, y, w, h, text, size, bold, color, align)
+            in enumerate(self.ops)]
+        frag = etree.fromstring(
+            f'<f xmlns:p="{_P_NS}" xmlns:a="{_A_NS}">{"".join(sps)}</f>')
+        spTree = sl.shapes._spTree
+        for sp in frag:
+            spTree.append(sp)
+        self.ops.clear()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 11. Card grid — 2x2 or 3x2 grid of cards with colored top-bar
 #     spec: {eyebrow, title, cards: [{icon?, title, description}], footer?}
 # ─────────────────────────────────────────────────────────────────────────────
 _CARD_COLORS = [TEAL, GREEN, ORANGE, RGBColor(0x9B, 0x59, 0xB6),
                 RGBColor(0xE7, 0x4C, 0x3C), RGBColor(0x34, 0x95, 0xDB)]
+_CARD_BG = RGBColor(0x1A, 0x24, 0x40)
+
+def _card(sl, ops, x, y, w, h, emu, icon, title, desc, bar_color):
+    """Draw a single card with color bar, icon, title, description.
 
-def _card(sl, x, y, w, h, icon, title, desc, bar_color):
-    """Draw a single card with color bar, icon, title, description."""
+    emu = (x, y, w, h, bar_h) pre-converted EMU values; w/h/bar_h are
+    loop-invariant and computed once by render_card_grid. Text goes into
+    the shared _TextOps queue; only the two rectangles are added here.
+    """
+    x_emu, y_emu, w_emu, h_emu, bar_h_emu = emu
     # Background rectangle
-    bg = sl.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                             Inches(x), Inches(y), Inches(w), Inches(h))
-    bg.fill.solid(); bg.fill.fore_color.rgb = RGBColor(0x1A, 0x24, 0x40)
+    bg = sl.shapes.add_shape(_RECT, x_emu, y_emu, w_emu, h_emu)
+    bg.fill.solid(); bg.fill.fore_color.rgb = _CARD_BG
     bg.line.fill.background()
     # Color bar at top
-    bar = sl.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                              Inches(x), Inches(y), Inches(w), Inches(0.05))
+    bar = sl.shapes.add_shape(_RECT, x_emu, y_emu, w_emu, bar_h_emu)
     bar.fill.solid(); bar.fill.fore_color.rgb = bar_color
     bar.line.fill.background()
     # Icon (emoji)
     if icon:
-        txb(sl, icon, x + 0.2, y + 0.2, 0.4, 0.4, size=18, color=WHITE)
+        ops.add(x + 0.2, y + 0.2, 0.4, 0.4, icon, size=18, color=WHITE)
     # Title
-    txb(sl, title, x + 0.65 if icon else x + 0.2, y + 0.2, w - 0.85, 0.4,
-        size=12, bold=True, color=WHITE)
+    ops.add(x + 0.65 if icon else x + 0.2, y + 0.2, w - 0.85, 0.4,
+            title, size=12, bold=True, color=WHITE)
     # Description
-    txb(sl, desc, x + 0.2, y + 0.65, w - 0.4, h - 0.8,
-        size=9, color=GRAY)
+    ops.add(x + 0.2, y + 0.65, w - 0.4, h - 0.8,
+            desc, size=9, color=GRAY)
 
 
 def render_card_grid(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
 
     cards = spec.get("cards", [])
     n = len(cards)
@@ -314,32 +465,76 @@ def render_card_grid(prs, SL, spec):
     card_h = 4.5 / rows - 0.15
     start_y = 2.0
 
+    # Loop-invariant EMU conversions, once per grid
+    w_emu, h_emu, bar_h_emu = _IN(card_w), _IN(card_h), _IN(0.05)
+
+    # Precompute the column/row coordinate vectors once; the per-card loop
+    # then only indexes, instead of redoing float math and EMU conversion
+    col_x = [0.6 + c * (card_w + 0.2) for c in range(cols)]
+    row_y = [start_y + r * (card_h + 0.15) for r in range(rows)]
+    col_x_emu = [_IN(x) for x in col_x]
+    row_y_emu = [_IN(y) for y in row_y]
+    palette = list(islice(cycle(_CARD_COLORS), n))
+    ops = _TextOps()
+
     for i, c in enumerate(cards):
         col = i % cols
         row = i // cols
-        x = 0.6 + col * (card_w + 0.2)
-        y = start_y + row * (card_h + 0.15)
-        _card(sl, x, y, card_w, card_h,
+        _card(sl, ops, col_x[col], row_y[row], card_w, card_h,
+              (col_x_emu[col], row_y_emu[row], w_emu, h_emu, bar_h_emu),
               c.get("icon", ""), c.get("title", ""), c.get("description", ""),
-              _CARD_COLORS[i % len(_CARD_COLORS)])
+              palette[i])
+    ops.flush(sl)
 
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Icon-bullet block — one textbox for a whole bullet column instead of two
+# shapes (marker + text) per bullet; halves shape count and lxml tree size
+# ─────────────────────────────────────────────────────────────────────────────
+_BULLET_P_XML = (
+    '<a:p><a:pPr><a:spcBef><a:spcPts val="{spc}"/></a:spcBef></a:pPr>'
+    '<a:r><a:rPr lang="en-US" sz="{msz}" b="1">'
+    '<a:solidFill><a:srgbClr val="{mcolor}"/></a:solidFill></a:rPr>'
+    '<a:t>{marker}</a:t></a:r>'
+    '<a:r><a:rPr lang="en-US" sz="{sz}">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p>'
+)
+
+
+def _bulleted_block(sl, x, y, w, h, items, marker="✓", marker_color=TEAL,
+                    text_color=WHITE, size=10, marker_size=11, space_pts=8):
+    """Single textbox with a two-run paragraph (colored marker + text) per item."""
+    tb = sl.shapes.add_textbox(_IN(x), _IN(y), _IN(w), _IN(h))
+    tf = tb.text_frame
+    tf.word_wrap = True
+    esc = saxutils.escape
+    paras = "".join(
+        _BULLET_P_XML.format(spc=space_pts * 100, msz=marker_size * 100,
+                             mcolor=str(marker_color), marker=esc(marker) + "  ",
+                             sz=size * 100, color=str(text_color), text=esc(str(t)))
+        for t in items)
+    txBody = tf._txBody
+    for p_el in txBody.findall(qn("a:p")):
+        txBody.remove(p_el)
+    frag = etree.fromstring(f'<f xmlns:a="{_A_NS}">{paras}</f>')
+    for p_el in frag:
+        txBody.append(p_el)
+    return tb
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 12. Icon bullets — eyebrow + subtitle + checkmark-prefixed bullets + optional image
 #     spec: {eyebrow, title, subtitle?, bullets: [str], image_path?, image_caption?}
 # ─────────────────────────────────────────────────────────────────────────────
 def render_icon_bullets(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
 
     subtitle = spec.get("subtitle", "")
     if subtitle:
@@ -347,31 +542,24 @@ def render_icon_bullets(prs, SL, spec):
 
     bullets = spec.get("bullets", [])
     img_path = spec.get("image_path", "")
-    has_img = img_path and os.path.isfile(img_path)
+    has_img = _is_file(img_path)
 
     bullet_w = 5.0 if has_img else 11.5
     y_start = 2.0 if not subtitle else 2.2
     spacing = 0.42
 
-    for i, b in enumerate(bullets):
-        y = y_start + i * spacing
-        # Checkmark icon
-        txb(sl, "✓", 0.6, y, 0.3, 0.35, size=11, bold=True, color=TEAL)
-        # Bullet text
-        txb(sl, b, 0.95, y, bullet_w, 0.35, size=10, color=WHITE)
+    if bullets:
+        _bulleted_block(sl, 0.6, y_start, bullet_w + 0.35,
+                        spacing * len(bullets), bullets)
 
     if has_img:
-        sl.shapes.add_picture(img_path,
-                              Inches(5.8), Inches(1.0),
-                              Inches(3.9), Inches(3.6))
+        _pic(sl, img_path, 5.8, 1.0, 3.9, 3.6)
         cap = spec.get("image_caption", "")
         if cap:
             txb(sl, cap, 5.8, 4.7, 3.9, 0.25,
                 size=8, color=GRAY, align=PP_ALIGN.CENTER)
 
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
@@ -382,11 +570,9 @@ def render_icon_bullets(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_split_panel(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
 
     subtitle = spec.get("subtitle", "")
     if subtitle:
@@ -394,12 +580,8 @@ def render_split_panel(prs, SL, spec):
 
     # Left: icon bullets
     bullets = spec.get("bullets", [])
-    y_start = 1.8
-    spacing = 0.42
-    for i, b in enumerate(bullets):
-        y = y_start + i * spacing
-        txb(sl, "✓", 0.6, y, 0.3, 0.35, size=11, bold=True, color=TEAL)
-        txb(sl, b, 0.95, y, 4.6, 0.35, size=10, color=WHITE)
+    if bullets:
+        _bulleted_block(sl, 0.6, 1.8, 4.95, 0.42 * len(bullets), bullets)
 
     # Right: panel
     panel_items = spec.get("panel_items", [])
@@ -408,28 +590,29 @@ def render_split_panel(prs, SL, spec):
     ph = len(panel_items) * 0.42 + 0.6
 
     # Panel background
-    bg = sl.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                             Inches(px), Inches(py), Inches(pw), Inches(ph))
-    bg.fill.solid(); bg.fill.fore_color.rgb = RGBColor(0x1A, 0x24, 0x40)
+    bg = sl.shapes.add_shape(_RECT,
+                             _IN(px), _IN(py), _IN(pw), _IN(ph))
+    bg.fill.solid(); bg.fill.fore_color.rgb = _CARD_BG
     bg.line.fill.background()
     # Panel color bar
-    bar = sl.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                              Inches(px), Inches(py), Inches(pw), Inches(0.05))
+    bar = sl.shapes.add_shape(_RECT,
+                              _IN(px), _IN(py), _IN(pw), _IN(0.05))
     bar.fill.solid(); bar.fill.fore_color.rgb = TEAL
     bar.line.fill.background()
 
     if panel_title:
         txb(sl, panel_title, px + 0.2, py + 0.15, pw - 0.4, 0.35,
             size=12, bold=True, color=WHITE)
+    # Loop invariants: item x-positions / width and the row y-vector
+    x_chk, x_txt, w_txt = px + 0.2, px + 0.45, pw - 0.65
+    iys = [py + 0.55 + i * 0.38 for i in range(len(panel_items))]
     for i, item in enumerate(panel_items):
         text = item if isinstance(item, str) else item.get("text", "")
-        iy = py + 0.55 + i * 0.38
-        txb(sl, "✓", px + 0.2, iy, 0.2, 0.3, size=9, color=TEAL)
-        txb(sl, text, px + 0.45, iy, pw - 0.65, 0.3, size=9, color=WHITE)
+        iy = iys[i]
+        txb(sl, "✓", x_chk, iy, 0.2, 0.3, size=9, color=TEAL)
+        txb(sl, text, x_txt, iy, w_txt, 0.3, size=9, color=WHITE)
 
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
@@ -440,25 +623,28 @@ def render_split_panel(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_two_image(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
-
-    for side, x in [("left", 0.5), ("right", 5.2)]:
-        img = spec.get(f"{side}_image", "")
-        cap = spec.get(f"{side}_caption", "")
-        if img and os.path.isfile(img):
-            sl.shapes.add_picture(img,
-                                  Inches(x), Inches(1.6), Inches(4.3), Inches(3.4))
-        if cap:
-            txb(sl, cap, x, 4.95, 4.3, 0.3,
-                size=8, color=GRAY, align=PP_ALIGN.CENTER)
-
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
+
+    # Unrolled: fixed two sides, so no f-string key building per slide
+    left_img  = spec.get("left_image", "")
+    left_cap  = spec.get("left_caption", "")
+    right_img = spec.get("right_image", "")
+    right_cap = spec.get("right_caption", "")
+
+    if _is_file(left_img):
+        _pic(sl, left_img, 0.5, 1.6, 4.3, 3.4)
+    if left_cap:
+        txb(sl, left_cap, 0.5, 4.95, 4.3, 0.3,
+            size=8, color=GRAY, align=PP_ALIGN.CENTER)
+    if _is_file(right_img):
+        _pic(sl, right_img, 5.2, 1.6, 4.3, 3.4)
+    if right_cap:
+        txb(sl, right_cap, 5.2, 4.95, 4.3, 0.3,
+            size=8, color=GRAY, align=PP_ALIGN.CENTER)
+
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
@@ -468,11 +654,9 @@ def render_two_image(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_value_props(prs, SL, spec):
     sl = _new(prs, SL, "title_content")
-    eyebrow = spec.get("eyebrow", "")
-    if eyebrow:
-        set_ph(sl, 1, eyebrow, size=10, color=TEAL, italic=True)
-    set_ph(sl, 0, spec.get("title", ""),
-           size=22, bold=True, color=WHITE)
+    _maybe_ph(sl, 1, spec.get("eyebrow"), size=10, color=TEAL, italic=True)
+    _maybe_ph(sl, 0, spec.get("title"),
+              size=22, bold=True, color=WHITE)
 
     subtitle = spec.get("subtitle", "")
     if subtitle:
@@ -482,21 +666,22 @@ def render_value_props(prs, SL, spec):
     props = spec.get("props", [])
     y_start = 1.95
     spacing = 0.6
+    ys = [y_start + i * spacing for i in range(len(props))]
+    ops = _TextOps()
 
     for i, p in enumerate(props):
-        y = y_start + i * spacing
+        y = ys[i]
         icon = p.get("icon", "●")
         title = p.get("title", "")
         desc  = p.get("description", "")
         # Icon circle
-        txb(sl, icon, 0.6, y, 0.3, 0.3, size=11, color=TEAL)
+        ops.add(0.6, y, 0.3, 0.3, icon, size=11, color=TEAL)
         # Bold title + description on same line
-        txb(sl, title, 1.05, y, 2.5, 0.3, size=11, bold=True, color=WHITE)
-        txb(sl, desc, 1.05, y + 0.25, 8.0, 0.3, size=9, color=GRAY)
+        ops.add(1.05, y, 2.5, 0.3, title, size=11, bold=True, color=WHITE)
+        ops.add(1.05, y + 0.25, 8.0, 0.3, desc, size=9, color=GRAY)
+    ops.flush(sl)
 
-    footer = spec.get("footer", "")
-    if footer:
-        txb(sl, footer, 0.5, 5.25, 9.0, 0.3, size=8, color=GRAY)
+    _footer(sl, spec.get("footer", ""))
     return sl
 
 
@@ -506,24 +691,22 @@ def render_value_props(prs, SL, spec):
 # ─────────────────────────────────────────────────────────────────────────────
 def render_cta(prs, SL, spec):
     sl = _new(prs, SL, "title_center")
-    brand = spec.get("brand", "dynatrace")
-    txb(sl, brand, 0.6, 0.4, 3.0, 0.5, size=16, bold=False, color=WHITE)
-    txb(sl, spec.get("headline", ""), 0.6, 2.0, 8.0, 0.9,
-        size=32, bold=True, color=WHITE)
+    _brand(sl, spec.get("brand", "dynatrace"))
+    txb_styled(sl, spec.get("headline", ""), 0.6, 2.0, 8.0, 0.9, _STYLE_CTA)
     sub = spec.get("sub_text", "")
     if sub:
-        txb(sl, sub, 0.6, 3.0, 7.0, 0.8, size=14, color=GRAY)
+        txb_styled(sl, sub, 0.6, 3.0, 7.0, 0.8, _STYLE_TAGLINE)
     cta = spec.get("cta_text", "")
     if cta:
-        btn = sl.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                   Inches(0.6), Inches(4.2), Inches(2.8), Inches(0.55))
+        btn = sl.shapes.add_shape(_ROUND,
+                                   _IN(0.6), _IN(4.2), _IN(2.8), _IN(0.55))
         btn.fill.solid(); btn.fill.fore_color.rgb = TEAL
         btn.line.fill.background()
         tf = btn.text_frame
         tf.word_wrap = True
         p = tf.paragraphs[0]; p.alignment = PP_ALIGN.CENTER
         r = p.add_run(); r.text = cta
-        r.font.size = Pt(13); r.font.bold = True; r.font.color.rgb = WHITE
+        r.font.size = _PT(13); r.font.bold = True; r.font.color.rgb = WHITE
     return sl
 
 
@@ -548,20 +731,42 @@ _RENDERERS = {
     "value_props":  render_value_props,
     "cta":          render_cta,
 }
+# Interned keys hit the dict's pointer-equality fast path for literal specs;
+# the proxy wrap makes the dispatch table read-only
+_RENDERERS = types.MappingProxyType(
+    {sys.intern(k): v for k, v in _RENDERERS.items()})
+
+_VALID_TYPES = tuple(_RENDERERS)
+_VALID_TYPES_MSG = f"Valid types: {_VALID_TYPES}"
 
 def render_slide(prs, SL, spec: dict):
     """Render a single slide from a spec dict. Returns the slide object."""
-    slide_type = spec.get("type", "bullets")
+    slide_type = spec.get("type") or "bullets"
     renderer = _RENDERERS.get(slide_type)
     if renderer is None:
         raise ValueError(f"Unknown slide type: '{slide_type}'. "
-                         f"Valid types: {list(_RENDERERS.keys())}")
+                         + _VALID_TYPES_MSG)
     return renderer(prs, SL, spec)
 
 
 def render_all(prs, SL, slides: list[dict]):
-    """Render a list of slide specs, returning all slide objects."""
-    results = []
-    for spec in slides:
-        results.append(render_slide(prs, SL, spec))
+    """Render a list of slide specs, returning all slide objects.
+
+    Rendering is deliberately sequential: every renderer mutates the shared
+    Presentation's lxml tree and relationship graph, neither of which is
+    picklable or safe to touch from another process/thread. The I/O-bound
+    part (image reads) is parallelized separately via prefetch_images().
+    """
+    # Resolve every spec's renderer up front: one dict lookup per slide,
+    # and unknown types fail before any slide is built
+    try:
+        dispatch = [(_RENDERERS[spec.get("type") or "bullets"], spec)
+                    for spec in slides]
+    except KeyError as e:
+        raise ValueError(f"Unknown slide type: '{e.args[0]}'. "
+                         + _VALID_TYPES_MSG) from None
+
+    results = [None] * len(slides)         # preallocate: no resize copies
+    for i, (renderer, spec) in enumerate(dispatch):
+        results[i] = renderer(prs, SL, spec)
     return results
@@ -2,54 +2,273 @@
 Low-level drawing helpers for the DT PPT builder.
 All positional args are in inches.
 """
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
+
+from lxml import etree
+from pptx.oxml.ns import qn
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
+from xml.sax import saxutils
+import io
 import os
 
 from .brand import (WHITE, TEAL, GREEN, ORANGE, GRAY, DGRAY, DDGRAY, DTDARK,
                     status_color, RGBColor)
 
 
+# Cached EMU conversions — the helpers are called with the same handful of
+# literal geometries and font sizes on every slide, so each Inches()/Pt()
+# construction is redundant after the first. Mirrors generic_slides._IN/_PT.
+@lru_cache(maxsize=256)
+def _in(x):
+    return Inches(round(x, 3))
+
+
+@lru_cache(maxsize=64)
+def _pt(x):
+    return Pt(x)
+
+
+# Positive-only existence cache: a screenshot recurring across slides costs
+# one stat(2) for the whole deck. Misses are re-checked so files created
+# mid-process (e.g. a capture between builds) are still picked up.
+_SEEN_FILES: set = set()
+
+
+def _is_file(path) -> bool:
+    if not path:
+        return False
+    if path in _SEEN_FILES:
+        return True
+    if os.path.isfile(path):
+        _SEEN_FILES.add(path)
+        return True
+    return False
+
+
+def _forget_file(path):
+    """Drop a stale positive — the file vanished after it was first seen."""
+    _SEEN_FILES.discard(path)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Image byte cache — lets builds prefetch screenshots concurrently and lets
+# repeated embeds of the same file skip the disk read. Bounded LRU (same
+# pattern as builder._TEMPLATE_CACHE) so long-running servers don't pin
+# every screenshot they ever embedded.
+# ─────────────────────────────────────────────────────────────────────────────
+_IMG_CACHE: OrderedDict = OrderedDict()   # path → (mtime_ns, bytes)
+_IMG_CACHE_MAX = 32
+
+
+def _image_bytes(path) -> bytes:
+    """Return (cached) raw file bytes for an image path."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    entry = _IMG_CACHE.get(path)
+    if entry is None or entry[0] != mtime_ns:
+        with open(path, "rb") as f:
+            entry = (mtime_ns, f.read())
+        _IMG_CACHE[path] = entry
+        while len(_IMG_CACHE) > _IMG_CACHE_MAX:
+            _IMG_CACHE.popitem(last=False)
+    else:
+        _IMG_CACHE.move_to_end(path)
+    return entry[1]
+
+
+# Prepared (downscaled / re-encoded) variants keyed by content hash only:
+# one canonical variant per source image, regardless of placement size, so
+# python-pptx's own sha1-based media dedupe collapses repeats (logos, shared
+# screenshots) into a single package part across slides. Bounded like
+# _IMG_CACHE; prepared bytes are also registered under their own hash so a
+# caller holding only the prepared variant hash-hits instead of re-encoding.
+_PREPARED_CACHE: OrderedDict = OrderedDict()
+_PREPARED_CACHE_MAX = 32
+_EMBED_MAX_PX = 1600   # long-edge pixel cap for embedded screenshots
+
+
+def _prepare_image(data: bytes) -> bytes:
+    """
+    Downscale oversized screenshots to the embed pixel cap and re-encode
+    as JPEG q=85 (PNG kept when transparency is present). python-pptx embeds
+    source bytes verbatim, so multi-MB screenshots inflate decks massively
+    without this. Results are cached by content sha1.
+    """
+    import hashlib
+    key = hashlib.sha1(data).hexdigest()
+    cached = _PREPARED_CACHE.get(key)
+    if cached is None:
+        try:
+            cached = _reencode(data, _EMBED_MAX_PX, _EMBED_MAX_PX)
+        except Exception:   # unreadable / exotic format — embed as-is
+            cached = data
+        _PREPARED_CACHE[key] = cached
+        if cached is not data:
+            # Same object under both hashes — no extra payload pinned
+            _PREPARED_CACHE[hashlib.sha1(cached).hexdigest()] = cached
+        while len(_PREPARED_CACHE) > _PREPARED_CACHE_MAX:
+            _PREPARED_CACHE.popitem(last=False)
+    else:
+        _PREPARED_CACHE.move_to_end(key)
+    return cached
+
+
+def _reencode(data: bytes, w_px: int, h_px: int) -> bytes:
+    from PIL import Image
+    img = Image.open(io.BytesIO(data))
+    resized = img.width > w_px or img.height > h_px
+    if resized:
+        img.thumbnail((w_px, h_px))
+    alpha = (img.mode in ("RGBA", "LA")
+             or (img.mode == "P" and "transparency" in img.info))
+    buf = io.BytesIO()
+    if alpha:
+        img.save(buf, format="PNG", optimize=True)
+    else:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=85)
+    out = buf.getvalue()
+    # Never regress: keep the original when re-encoding didn't help
+    return out if len(out) < len(data) else data
+
+
+def prefetch_images(paths, max_workers=4):
+    """Warm the image byte cache for the given paths, reading concurrently.
+
+    Slide rendering itself must stay single-threaded (python-pptx slide
+    mutation is not thread-safe), but the disk reads can overlap here.
+    """
+    todo = [p for p in set(paths)
+            if _is_file(p) and p not in _IMG_CACHE]
+    if not todo:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _load(p):
+        try:
+            with open(p, "rb") as f:
+                data = f.read()
+            _IMG_CACHE[p] = (os.stat(p).st_mtime_ns, data)
+        except OSError:   # vanished since the existence check
+            _forget_file(p)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(todo))) as ex:
+        list(ex.map(_load, todo))
+    while len(_IMG_CACHE) > _IMG_CACHE_MAX:
+        _IMG_CACHE.popitem(last=False)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Placeholder setter
 # ─────────────────────────────────────────────────────────────────────────────
 def set_ph(slide, ph_idx, text, size=None, bold=False, color=WHITE,
            align=PP_ALIGN.LEFT, italic=False):
-    """Write text into a layout placeholder by idx."""
-    for ph in slide.placeholders:
-        if ph.placeholder_format.idx == ph_idx:
-            tf = ph.text_frame
-            tf.word_wrap = True
-            tf.clear()
-            p = tf.paragraphs[0]
-            p.alignment = align
-            r = p.add_run()
-            r.text = text
-            if size:       r.font.size   = Pt(size)
-            r.font.bold    = bold
-            r.font.italic  = italic
-            r.font.color.rgb = color
-            return ph
-    return None
+    """Write text into a layout placeholder by idx.
+
+    The idx→placeholder map is built once per slide and cached on the
+    slide object, so repeated set_ph calls skip the placeholder XML walk.
+    """
+    cache = getattr(slide, "_ph_idx_cache", None)
+    if cache is None:
+        cache = {ph.placeholder_format.idx: ph for ph in slide.placeholders}
+        slide._ph_idx_cache = cache
+    ph = cache.get(ph_idx)
+    if ph is None:
+        return None
+    tf = ph.text_frame
+    # Only mutate the bodyPr / paragraph XML when the inherited state needs
+    # it — layout placeholders usually arrive wrapped and empty already
+    if tf.word_wrap is not True:
+        tf.word_wrap = True
+    paras = tf.paragraphs
+    if len(paras) > 1 or paras[0].runs:
+        tf.clear()
+        paras = tf.paragraphs
+    p = paras[0]
+    p.alignment = align
+    r = p.add_run()
+    r.text = text
+    if size:       r.font.size   = _pt(size)
+    r.font.bold    = bold
+    r.font.italic  = italic
+    _run_color(r, color)
+    return ph
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Text box
 # ─────────────────────────────────────────────────────────────────────────────
+_TXB_P_XML = (
+    '<a:p>{ppr}<a:r><a:rPr lang="en-US" sz="{sz}"{b}{i}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p>'
+)
+
+_ALGN_PPR = {PP_ALIGN.CENTER: '<a:pPr algn="ctr"/>',
+             PP_ALIGN.RIGHT:  '<a:pPr algn="r"/>'}
+
+
 def txb(slide, text, l, t, w, h,
         size=12, bold=False, color=WHITE, align=PP_ALIGN.LEFT, italic=False):
-    """Add a word-wrapped textbox."""
-    tb = slide.shapes.add_textbox(Inches(l), Inches(t), Inches(w), Inches(h))
+    """Add a word-wrapped textbox.
+
+    Embedded newlines become real paragraphs, composed as one XML fragment
+    — one textbox and one parse instead of a shape per line.
+    """
+    tb = slide.shapes.add_textbox(_in(l), _in(t), _in(w), _in(h))
     tf = tb.text_frame
     tf.word_wrap = True
+    if "\n" in text:
+        esc = saxutils.escape
+        ppr = _ALGN_PPR.get(align, "")
+        sz = int(size * 100)
+        b  = ' b="1"' if bold else ''
+        i  = ' i="1"' if italic else ''
+        color_hex = _HEX.get(color) or str(color)
+        parts = "".join(
+            _TXB_P_XML.format(ppr=ppr, sz=sz, b=b, i=i, color=color_hex,
+                              text=esc(line))
+            for line in text.split("\n"))
+        txBody = tf._txBody
+        for p_el in txBody.findall(qn("a:p")):
+            txBody.remove(p_el)
+        frag = etree.fromstring(f'<f xmlns:a="{_A_NS}">{parts}</f>')
+        for p_el in frag:
+            txBody.append(p_el)
+        return tb
     p  = tf.paragraphs[0]
     p.alignment = align
     r  = p.add_run()
     r.text           = text
-    r.font.size      = Pt(size)
+    r.font.size      = _pt(size)
     r.font.bold      = bold
     r.font.italic    = italic
-    r.font.color.rgb = color
+    _run_color(r, color)
+    return tb
+
+
+def txb_styled(slide, text, l, t, w, h, style):
+    """txb fast path for fixed call-site styles.
+
+    `style` is a precomputed (size_pt, bold, color, align) tuple — the Pt
+    value is converted once where the tuple is defined, and no kwargs dict
+    is built per call. align=None keeps the default left alignment.
+    """
+    size_pt, bold, color, align = style
+    tb = slide.shapes.add_textbox(_in(l), _in(t), _in(w), _in(h))
+    tf = tb.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    if align is not None:
+        p.alignment = align
+    r = p.add_run()
+    r.text           = text
+    r.font.size      = size_pt
+    r.font.bold      = bold
+    _run_color(r, color)
     return tb
 
 
@@ -58,48 +277,180 @@ def txb(slide, text, l, t, w, h,
 # ─────────────────────────────────────────────────────────────────────────────
 def para_block(slide, lines, l, t, w, h, size=11, color=WHITE,
                hdr=None, hdr_color=TEAL, hdr_size=13):
-    """Textbox with optional bold header then bullet lines (▸ prefix)."""
-    tb = slide.shapes.add_textbox(Inches(l), Inches(t), Inches(w), Inches(h))
+    """Textbox with optional bold header then bullet lines (▸ prefix).
+
+    Delegates to para_block_xml: the per-bullet add_paragraph/add_run
+    setter walk this used to do is replaced by one composed XML parse.
+    """
+    return para_block_xml(slide, lines, l, t, w, h, size=size, color=color,
+                          hdr=hdr, hdr_color=hdr_color, hdr_size=hdr_size)
+
+
+# Batched variant — per-paragraph add_paragraph/add_run descriptor walks
+# dominate para_block for long bullet lists, so this composes the whole
+# body as one XML string and parses it in a single lxml call.
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+_HDR_P_XML = (
+    '<a:p><a:r><a:rPr lang="en-US" sz="{sz}" b="1">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p>'
+)
+_BULLET_LINE_XML = (
+    '<a:p><a:pPr><a:spcBef><a:spcPts val="300"/></a:spcBef></a:pPr>'
+    '<a:r><a:rPr lang="en-US" sz="{sz}">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p>'
+)
+
+
+def para_block_xml(slide, lines, l, t, w, h, size=11, color=WHITE,
+                   hdr=None, hdr_color=TEAL, hdr_size=13):
+    """para_block equivalent built as one composed <a:p> sequence."""
+    if not lines and not hdr:
+        return None
+    tb = slide.shapes.add_textbox(_in(l), _in(t), _in(w), _in(h))
     tf = tb.text_frame
     tf.word_wrap = True
-    first = True
+    esc = saxutils.escape
+    sz, color_hex = size * 100, _HEX.get(color) or str(color)
+    parts = []
     if hdr:
-        p = tf.paragraphs[0]; first = False
-        r = p.add_run()
-        r.text           = hdr
-        r.font.size      = Pt(hdr_size)
-        r.font.bold      = True
-        r.font.color.rgb = hdr_color
-    for line in lines:
-        p = tf.paragraphs[0] if first else tf.add_paragraph()
-        first = False
-        p.space_before   = Pt(3)
-        r = p.add_run()
-        r.text           = f"\u25b8  {line}"
-        r.font.size      = Pt(size)
-        r.font.color.rgb = color
+        parts.append(_HDR_P_XML.format(sz=hdr_size * 100,
+                                       color=_HEX.get(hdr_color) or str(hdr_color),
+                                       text=esc(str(hdr))))
+    parts.extend(_BULLET_LINE_XML.format(sz=sz, color=color_hex,
+                                         text=esc(f"▸  {line}"))
+                 for line in lines)
+    txBody = tf._txBody
+    for p_el in txBody.findall(qn("a:p")):
+        txBody.remove(p_el)
+    frag = etree.fromstring(f'<f xmlns:a="{_A_NS}">{"".join(parts)}</f>')
+    for p_el in frag:
+        txBody.append(p_el)
     return tb
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Status badges bar  (✅ Now | ⚡ Partial | 🗺 Roadmap)
 # ─────────────────────────────────────────────────────────────────────────────
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+# Badge pill: solid fill, no outline, centered bold white text. The lIns/tIns
+# margins are the old 0.04in/0.02in in EMU.
+_BADGE_SP_XML = (
+    '<p:sp>'
+    '<p:nvSpPr><p:cNvPr id="{sid}" name="Badge {sid}"/>'
+    '<p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{bg}"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln></p:spPr>'
+    '<p:txBody>'
+    '<a:bodyPr wrap="square" lIns="36576" tIns="18288" rIns="36576" bIns="18288"/>'
+    '<a:lstStyle/><a:p><a:pPr algn="ctr"/>'
+    '<a:r><a:rPr lang="en-US" sz="900" b="1">'
+    '<a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>'
+)
+
+_BAR_TXT_SP_XML = (
+    '<p:sp>'
+    '<p:nvSpPr><p:cNvPr id="{sid}" name="TextBox {sid}"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/>'
+    '<a:p><a:r><a:rPr lang="en-US" sz="1000">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>'
+)
+
+_STATUS_GRP_XML = (
+    '<p:grpSp xmlns:p="{pns}" xmlns:a="{ans}">'
+    '<p:nvGrpSpPr><p:cNvPr id="{sid}" name="Status Bar"/>'
+    '<p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr><a:xfrm>'
+    '<a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+    '<a:chOff x="{x}" y="{y}"/><a:chExt cx="{cx}" cy="{cy}"/>'
+    '</a:xfrm></p:grpSpPr>{children}</p:grpSp>'
+)
+
+
 def status_bar(slide, now, partial, roadmap, total, left=0.7, top=2.38):
-    """Three coloured pill badges + total requirement count."""
-    def _badge(text, l, bg):
-        s = slide.shapes.add_shape(5, Inches(l), Inches(top), Inches(1.32), Inches(0.27))
-        s.fill.solid(); s.fill.fore_color.rgb = bg; s.line.fill.background()
-        tf = s.text_frame
-        tf.margin_left = tf.margin_right = Inches(0.04)
-        tf.margin_top  = tf.margin_bottom = Inches(0.02)
-        p  = tf.paragraphs[0]; p.alignment = PP_ALIGN.CENTER
-        r  = p.add_run(); r.text = text
-        r.font.size = Pt(9); r.font.bold = True; r.font.color.rgb = WHITE
-    _badge(f"\u2705  {now} Now",         left,        GREEN)
-    _badge(f"\u26a1  {partial} Partial",  left + 1.4,  ORANGE)
-    _badge(f"\U0001f5fa  {roadmap} Roadmap", left + 2.8, RGBColor(0x55, 0x55, 0x55))
-    txb(slide, f"of {total} requirements", left + 4.25, top + 0.02, 2.5, 0.28,
-        size=10, color=GRAY)
+    """Three coloured pill badges + total requirement count.
+
+    Composed as a single <p:grpSp> appended to the shape tree once \u2014 one
+    insertion instead of four add_shape/add_textbox round trips, with the
+    fills written directly rather than via per-shape FillFormat proxies.
+    chOff/chExt mirror off/ext so children keep slide coordinates.
+    """
+    shapes = slide.shapes
+    sid = shapes._next_shape_id
+    y, cy, bw = _in(top), _in(0.27), _in(1.32)
+    esc = saxutils.escape
+    badges = ((f"\u2705  {now} Now",          left,       _HEX[GREEN]),
+              (f"\u26a1  {partial} Partial",   left + 1.4, _HEX[ORANGE]),
+              (f"\U0001f5fa  {roadmap} Roadmap", left + 2.8, "555555"))
+    children = [_BADGE_SP_XML.format(sid=sid + 1 + i, x=_in(l), y=y,
+                                     cx=bw, cy=cy, bg=bg, text=esc(text))
+                for i, (text, l, bg) in enumerate(badges)]
+    children.append(_BAR_TXT_SP_XML.format(
+        sid=sid + 4, x=_in(left + 4.25), y=_in(top + 0.02),
+        cx=_in(2.5), cy=_in(0.28), color=_HEX[GRAY],
+        text=esc(f"of {total} requirements")))
+    grp = etree.fromstring(_STATUS_GRP_XML.format(
+        pns=_P_NS, ans=_A_NS, sid=sid,
+        x=_in(left), y=y, cx=_in(6.75), cy=_in(0.30),
+        children="".join(children)))
+    shapes._spTree.append(grp)
+
+
+# Hex serializations of the brand palette, computed once — str(RGBColor)
+# reformats the byte triple on every call otherwise
+_HEX = {c: str(c)
+        for c in (WHITE, TEAL, GREEN, ORANGE, GRAY, DGRAY, DDGRAY, DTDARK)}
+
+
+# Interned <a:solidFill> prototypes, one per distinct color — cell shading
+# and run coloring both deep-copy these instead of letting the FillFormat /
+# ColorFormat proxies rebuild the subtree attribute by attribute each time
+_FILL_CACHE: dict = {}
+
+
+def _solidfill(color):
+    key = _HEX.get(color) or str(color)
+    proto = _FILL_CACHE.get(key)
+    if proto is None:
+        proto = etree.fromstring(
+            f'<a:solidFill xmlns:a="{_A_NS}">'
+            f'<a:srgbClr val="{key}"/></a:solidFill>')
+        _FILL_CACHE[key] = proto
+    return proto
+
+
+def _cell_bg(cell, color):
+    cell._tc.get_or_add_tcPr().append(deepcopy(_solidfill(color)))
+
+
+def _run_color(r, color):
+    """Color a fresh run by cloning the interned solidFill into its rPr."""
+    r._r.get_or_add_rPr().append(deepcopy(_solidfill(color)))
+
+
+# Zebra striping indexed by ri & 1 instead of a per-row branch
+_ROW_BG = (DGRAY, DDGRAY)
+_ROW_BG_HEX = (_HEX[DGRAY], _HEX[DDGRAY])
+
+# Full table cell (text run + fill) as one composable fragment — same
+# row-at-a-time injection pattern as generic_slides.render_table
+_TC_XML = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>'
+    '<a:p>{ppr}<a:r><a:rPr lang="en-US" sz="{sz}"{b}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r></a:p></a:txBody>'
+    '<a:tcPr><a:solidFill><a:srgbClr val="{bg}"/></a:solidFill></a:tcPr></a:tc>'
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -112,27 +463,43 @@ def req_table(slide, reqs, l, t, w, h):
     """
     cols = ["Requirement", "Description", "Status", "Signal"]
     tbl  = slide.shapes.add_table(
-        len(reqs) + 1, 4, Inches(l), Inches(t), Inches(w), Inches(h)).table
-    for c, cw in enumerate([w * f for f in [0.40, 0.29, 0.17, 0.14]]):
-        tbl.columns[c].width = Inches(cw)
-    # Header row
-    for c, h_txt in enumerate(cols):
-        cell = tbl.cell(0, c)
-        p = cell.text_frame.paragraphs[0]
-        r = p.add_run(); r.text = h_txt
-        r.font.size = Pt(8); r.font.bold = True; r.font.color.rgb = TEAL
-        cell.fill.solid(); cell.fill.fore_color.rgb = DTDARK
-    # Data rows
+        len(reqs) + 1, 4, _in(l), _in(t), _in(w), _in(h)).table
+    tbl_el = tbl._tbl
+    # Column widths written straight onto the gridCol elements — skips the
+    # columns[c] proxy construction per column
+    for col_el, f in zip(tbl_el.tblGrid, (0.40, 0.29, 0.17, 0.14)):
+        col_el.set("w", str(int(_in(w * f))))
+
+    # Rows composed as XML and swapped in wholesale — per-cell
+    # text_frame/paragraphs/add_run proxy walks cost 3-4 lxml descents per
+    # cell on the old path
+    esc = saxutils.escape
+    trs = tbl_el.findall(qn("a:tr"))
+    teal_hex, white_hex = _HEX[TEAL], _HEX[WHITE]
+    hdr_cells = "".join(
+        _TC_XML.format(ppr="", sz=800, b=' b="1"', color=teal_hex,
+                       text=esc(h_txt), bg=_HEX[DTDARK])
+        for h_txt in cols)
+    new_rows = [f'<a:tr xmlns:a="{_A_NS}" h="{trs[0].get("h")}">{hdr_cells}</a:tr>']
     for ri, (name, desc, st, sig) in enumerate(reqs):
-        bg = DGRAY if ri % 2 == 0 else DDGRAY
-        for c, val in enumerate([name, desc, st, sig]):
-            cell = tbl.cell(ri + 1, c)
-            p    = cell.text_frame.paragraphs[0]
-            r    = p.add_run(); r.text = val
-            r.font.size = Pt(7.5)
-            cell.fill.solid(); cell.fill.fore_color.rgb = bg
-            r.font.color.rgb = (status_color(val) if c == 2 else
-                                TEAL               if c == 3 else WHITE)
+        bg = _ROW_BG_HEX[ri & 1]
+        sc = status_color(st)
+        cells = (
+            _TC_XML.format(ppr="", sz=750, b="", color=white_hex,
+                           text=esc(name), bg=bg)
+            + _TC_XML.format(ppr="", sz=750, b="", color=white_hex,
+                             text=esc(desc), bg=bg)
+            + _TC_XML.format(ppr="", sz=750, b="",
+                             color=_HEX.get(sc) or str(sc),
+                             text=esc(st), bg=bg)
+            + _TC_XML.format(ppr="", sz=750, b="", color=teal_hex,
+                             text=esc(sig), bg=bg))
+        new_rows.append(
+            f'<a:tr xmlns:a="{_A_NS}" h="{trs[ri + 1].get("h")}">{cells}</a:tr>')
+    for tr in trs:
+        tbl_el.remove(tr)
+    for row_xml in new_rows:
+        tbl_el.append(etree.fromstring(row_xml))
     return tbl
 
 
@@ -141,9 +508,22 @@ def req_table(slide, reqs, l, t, w, h):
 # ─────────────────────────────────────────────────────────────────────────────
 def add_img(slide, path, l, t, w, h):
     """Embed an image if the file exists; silently skip if not."""
-    if path and os.path.exists(path):
-        return slide.shapes.add_picture(path, Inches(l), Inches(t),
-                                        Inches(w), Inches(h))
+    if _is_file(path):
+        try:
+            raw = _image_bytes(path)
+        except OSError:   # seen earlier, deleted since — warn-and-skip
+            _forget_file(path)
+        else:
+            data = _prepare_image(raw)
+            if data is not raw:
+                # Keep one payload per image: once the smaller prepared
+                # variant exists, later embeds hash-hit it, so the raw
+                # bytes can go
+                entry = _IMG_CACHE.get(path)
+                if entry is not None and entry[1] is raw:
+                    _IMG_CACHE[path] = (entry[0], data)
+            return slide.shapes.add_picture(io.BytesIO(data), _in(l), _in(t),
+                                            _in(w), _in(h))
     print(f"  [WARN] image not found: {path}")
     return None
 
@@ -157,10 +537,13 @@ def coverage_table(slide, domains, l=0.7, t=2.3, w=11.94, h=4.6):
         name, total, now, partial, roadmap
     Final row is auto-generated TOTAL.
     """
-    tot_total   = sum(d["total"]   for d in domains)
-    tot_now     = sum(d["now"]     for d in domains)
-    tot_partial = sum(d["partial"] for d in domains)
-    tot_roadmap = sum(d["roadmap"] for d in domains)
+    # One pass over the domain dicts for all four totals
+    tot_total = tot_now = tot_partial = tot_roadmap = 0
+    for d in domains:
+        tot_total   += d["total"]
+        tot_now     += d["now"]
+        tot_partial += d["partial"]
+        tot_roadmap += d["roadmap"]
 
     data_rows = [[d["name"], str(d["total"]),
                   str(d["now"]), str(d["partial"]), str(d["roadmap"])]
@@ -173,9 +556,9 @@ def coverage_table(slide, domains, l=0.7, t=2.3, w=11.94, h=4.6):
     ])
 
     tbl = slide.shapes.add_table(
-        len(data_rows) + 1, 5, Inches(l), Inches(t), Inches(w), Inches(h)).table
-    for c, cw in enumerate([5.5, 1.1, 1.8, 1.8, 1.74]):
-        tbl.columns[c].width = Inches(cw)
+        len(data_rows) + 1, 5, _in(l), _in(t), _in(w), _in(h)).table
+    for col_el, cw in zip(tbl._tbl.tblGrid, (5.5, 1.1, 1.8, 1.8, 1.74)):
+        col_el.set("w", str(int(_in(cw))))
 
     from .brand import GREEN, ORANGE, GRAY, WHITE, DTDARK, DGRAY, DDGRAY, TEAL
     hdrs = ["Domain", "Total", "\u2705 Now", "\u26a1 Partial", "\U0001f5fa Roadmap"]
@@ -183,22 +566,22 @@ def coverage_table(slide, domains, l=0.7, t=2.3, w=11.94, h=4.6):
         cell = tbl.cell(0, c)
         p    = cell.text_frame.paragraphs[0]; p.alignment = PP_ALIGN.CENTER
         r    = p.add_run(); r.text = h_txt
-        r.font.size = Pt(10); r.font.bold = True; r.font.color.rgb = TEAL
-        cell.fill.solid(); cell.fill.fore_color.rgb = DTDARK
+        r.font.size = _pt(10); r.font.bold = True
+        _run_color(r, TEAL)
+        _cell_bg(cell, DTDARK)
 
     for ri, row in enumerate(data_rows):
         is_total = (ri == len(data_rows) - 1)
-        bg = DTDARK if is_total else (DGRAY if ri % 2 == 0 else DDGRAY)
+        bg = DTDARK if is_total else _ROW_BG[ri & 1]
         for c, val in enumerate(row):
             cell = tbl.cell(ri + 1, c)
             p    = cell.text_frame.paragraphs[0]
             p.alignment = PP_ALIGN.LEFT if c == 0 else PP_ALIGN.CENTER
             r    = p.add_run(); r.text = val
-            r.font.size = Pt(11 if is_total else 10)
+            r.font.size = _pt(11 if is_total else 10)
             r.font.bold = is_total
-            cell.fill.solid(); cell.fill.fore_color.rgb = bg
-            if c == 2:   r.font.color.rgb = GREEN
-            elif c == 3: r.font.color.rgb = ORANGE
-            elif c == 4: r.font.color.rgb = GRAY
-            else:        r.font.color.rgb = WHITE
+            _cell_bg(cell, bg)
+            _run_color(r, GREEN  if c == 2 else
+                          ORANGE if c == 3 else
+                          GRAY   if c == 4 else WHITE)
     return tbl
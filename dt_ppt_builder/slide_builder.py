@@ -17,8 +17,8 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 
 from .brand import WHITE, TEAL, GREEN, ORANGE, PURPLE, GRAY, DTDARK, RGBColor
-from .helpers import (set_ph, txb, para_block, status_bar,
-                      req_table, add_img, coverage_table)
+from .helpers import (set_ph, txb, para_block, status_bar, req_table,
+                      add_img, coverage_table, prefetch_images, _is_file)
 
 import os
 
@@ -32,13 +32,18 @@ def _new(prs, SL, key):
 
 
 def _img_path(cfg, key):
-    """Resolve an image key to an absolute path using config."""
-    shots_dir = cfg.get("screenshots_dir", "")
-    mapping   = cfg.get("images", {})
-    filename  = mapping.get(key, "")
-    if not filename:
-        return None
-    return os.path.join(shots_dir, filename)
+    """Resolve an image key to an absolute path using config.
+
+    The joined paths are computed once per cfg and stashed back on it, so
+    every later lookup is a single dict hit.
+    """
+    cache = cfg.get("_image_paths_cache")
+    if cache is None:
+        shots_dir = cfg.get("screenshots_dir", "")
+        cache = {k: os.path.join(shots_dir, v)
+                 for k, v in cfg.get("images", {}).items() if v}
+        cfg["_image_paths_cache"] = cache
+    return cache.get(key)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -52,7 +57,7 @@ def title_slide(prs, SL, cfg):
            align=PP_ALIGN.CENTER)
     # Optional customer logo
     logo = cfg.get("customer_logo")
-    if logo and os.path.exists(logo):
+    if _is_file(logo):
         add_img(sl, logo, 10.8, 6.8, 2.2, 0.55)
     return sl
 
@@ -122,9 +127,18 @@ def domain_slide(prs, SL, cfg, domain_label, reqs,
         txb(sl, description, 0.5, 1.55, 12.5, 0.4, size=10, color=GRAY)
 
     if show_bar:
-        now      = sum(1 for r in reqs if "✅" in r[2] or "Now" in r[2])
-        partial  = sum(1 for r in reqs if "⚡" in r[2] or "Partial" in r[2])
-        roadmap  = sum(1 for r in reqs if "🗺" in r[2] or "Roadmap" in r[2])
+        # Single pass; status strings lead with their emoji, so the first
+        # char settles the bucket without substring scans
+        now = partial = roadmap = 0
+        for r in reqs:
+            s = r[2]
+            c = s[0] if s else ""
+            if c == "✅" or "Now" in s:
+                now += 1
+            elif c == "⚡" or "Partial" in s:
+                partial += 1
+            elif c == "🗺" or "Roadmap" in s:
+                roadmap += 1
         status_bar(sl, now, partial, roadmap, len(reqs), left=0.5, top=2.0)
         table_top = 2.42
     else:
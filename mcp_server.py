@@ -17,15 +17,27 @@ Transport: stdio  (works with Copilot Chat, VS Code, Claude Desktop, etc.)
 
 Start:
     py mcp_server.py
+
+Env:
+    DT_PPT_SKIP_SCHEMA=1 — register tools with minimal input schemas,
+    skipping per-call argument validation (production; keep full schemas
+    in dev/CI so clients get proper parameter docs and checking).
 """
 
 import asyncio
+import functools
 import json
 import os
 import sys
 
-# Ensure the package is importable when running from repo root
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Package root = where this script lives
+PKG_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Ensure the package is importable when running from repo root; the
+# sentinel check keeps reloads from stacking duplicate entries that every
+# later import lookup would have to walk past
+if PKG_ROOT not in sys.path:
+    sys.path.insert(0, PKG_ROOT)
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -34,11 +46,26 @@ from mcp.types import (
     TextContent,
 )
 
-import yaml
+# PyYAML is imported lazily via _yaml() — loading the libyaml C extension
+# costs tens of ms at startup, and several tools never touch YAML
+
+# Optional Rust JSON parser — requirement sets parse 2-5x faster with it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser — lets the summary tool scan large
+# requirements files one domain at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-# Package root = where this script lives
-PKG_ROOT    = os.path.dirname(os.path.abspath(__file__))
 CONFIGS_DIR = os.path.join(PKG_ROOT, "configs")
+# Fixed per-customer file suffixes, joined by concatenation in hot loops
+_CFG_SUFFIX  = os.sep + "config.yaml"
+_REQS_SUFFIX = os.sep + "requirements.json"
 
 server = Server("dt-ppt-builder")
 
@@ -66,193 +93,210 @@ SLIDE_TYPE_DOCS = (
     "  • cta          — {brand?, headline, sub_text?, cta_text?}  (call-to-action closing)"
 )
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        # ── PRIMARY: dynamic content-driven deck builder ─────────────────
-        Tool(
-            name="build_deck",
-            description=(
-                "Build a Dynatrace-branded PPTX slide deck from dynamic content. "
-                "YOU generate the slide content — the tool renders it with "
-                "Dynatrace branding and saves the PPTX.\n\n"
-                "Pass an array of slide spec objects. Each has a 'type' field "
-                "plus type-specific content fields.\n\n"
-                + SLIDE_TYPE_DOCS
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template_path": {
-                        "type": "string",
-                        "description": (
-                            "Absolute path to a .pptx or .potx template file. "
-                            "This provides the slide masters, backgrounds, and fonts."
-                        ),
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Absolute path where the generated .pptx should be saved.",
-                    },
-                    "slides": {
-                        "type": "array",
-                        "description": (
-                            "Array of slide spec objects. Each must have a 'type' "
-                            "field (title/section/bullets/table/two_column/text/"
-                            "image/comparison/closing) plus type-specific content."
-                        ),
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "type": {
-                                    "type": "string",
-                                    "enum": [
-                                        "title", "section", "bullets", "table",
-                                        "two_column", "text", "image",
-                                        "comparison", "closing"
-                                    ],
-                                },
+# The tool list is fully static — built once at import so every MCP
+# list_tools round trip returns the same Tool objects instead of
+# reconstructing the nested schema dicts per call. Invariant: nothing may
+# mutate these Tool objects or their schema dicts after import; the same
+# instances are handed to the framework on every tools/list RPC.
+_TOOLS: list[Tool] = [
+    # ── PRIMARY: dynamic content-driven deck builder ─────────────────
+    Tool(
+        name="build_deck",
+        description=(
+            "Build a Dynatrace-branded PPTX slide deck from dynamic content. "
+            "YOU generate the slide content — the tool renders it with "
+            "Dynatrace branding and saves the PPTX.\n\n"
+            "Pass an array of slide spec objects. Each has a 'type' field "
+            "plus type-specific content fields.\n\n"
+            + SLIDE_TYPE_DOCS
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "template_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path to a .pptx or .potx template file. "
+                        "This provides the slide masters, backgrounds, and fonts."
+                    ),
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Absolute path where the generated .pptx should be saved.",
+                },
+                "slides": {
+                    "type": "array",
+                    "description": (
+                        "Array of slide spec objects. Each must have a 'type' "
+                        "field (title/section/bullets/table/two_column/text/"
+                        "image/comparison/closing) plus type-specific content."
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {
+                                "type": "string",
+                                "enum": [
+                                    "title", "section", "bullets", "table",
+                                    "two_column", "text", "image",
+                                    "comparison", "closing"
+                                ],
                             },
-                            "required": ["type"],
                         },
+                        "required": ["type"],
                     },
-                    "layout_indices": {
-                        "type": "object",
-                        "description": (
-                            "Optional. Override default layout index mapping. "
-                            "Keys: title_center (default 11), title_content (default 2), "
-                            "two_img (default 19). Adjust for your template."
-                        ),
-                    },
                 },
-                "required": ["template_path", "output_path", "slides"],
+                "layout_indices": {
+                    "type": "object",
+                    "description": (
+                        "Optional. Override default layout index mapping. "
+                        "Keys: title_center (default 11), title_content (default 2), "
+                        "two_img (default 19). Adjust for your template."
+                    ),
+                },
             },
+            "required": ["template_path", "output_path", "slides"],
+        },
+    ),
+
+    # ── Config-based deck builder (pre-built customer configs) ───────
+    Tool(
+        name="build_customer_deck",
+        description=(
+            "Build a Dynatrace-branded PPTX from a pre-built customer config. "
+            "The customer must have a config.yaml and requirements.json under "
+            "configs/<customer>/. Use list_customers to see available configs."
         ),
-
-        # ── Config-based deck builder (pre-built customer configs) ───────
-        Tool(
-            name="build_customer_deck",
-            description=(
-                "Build a Dynatrace-branded PPTX from a pre-built customer config. "
-                "The customer must have a config.yaml and requirements.json under "
-                "configs/<customer>/. Use list_customers to see available configs."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer": {
-                        "type": "string",
-                        "description": (
-                            "Customer name matching a folder under configs/ "
-                            "(e.g. 'example'). Use list_customers to see options."
-                        ),
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": (
-                            "Optional override for the output .pptx file path. "
-                            "If omitted, uses the path from the customer's config.yaml."
-                        ),
-                    },
-                    "config_overrides": {
-                        "type": "object",
-                        "description": (
-                            "Optional dict of config keys to override "
-                            "(e.g. deck_title, deck_subtitle, closing_message)."
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer": {
+                    "type": "string",
+                    "description": (
+                        "Customer name matching a folder under configs/ "
+                        "(e.g. 'example'). Use list_customers to see options."
+                    ),
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": (
+                        "Optional override for the output .pptx file path. "
+                        "If omitted, uses the path from the customer's config.yaml."
+                    ),
+                },
+                "config_overrides": {
+                    "type": "object",
+                    "description": (
+                        "Optional dict of config keys to override "
+                        "(e.g. deck_title, deck_subtitle, closing_message)."
+                    ),
                 },
-                "required": ["customer"],
             },
-        ),
+            "required": ["customer"],
+        },
+    ),
 
-        Tool(
-            name="list_customers",
-            description=(
-                "List all available pre-built customer configurations. "
-                "These can be used with build_customer_deck."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+    Tool(
+        name="list_customers",
+        description=(
+            "List all available pre-built customer configurations. "
+            "These can be used with build_customer_deck."
         ),
-
-        Tool(
-            name="parse_excel",
-            description=(
-                "Parse a customer requirements Excel file (.xlsx) into the "
-                "canonical JSON structure used by build_customer_deck. "
-                "Supports multi-sheet or single-sheet formats."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "excel_path": {
-                        "type": "string",
-                        "description": "Absolute path to the .xlsx file.",
-                    },
-                    "output_json_path": {
-                        "type": "string",
-                        "description": (
-                            "Optional path to save the parsed JSON. "
-                            "If omitted, returns JSON in the response only."
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+
+    Tool(
+        name="parse_excel",
+        description=(
+            "Parse a customer requirements Excel file (.xlsx) into the "
+            "canonical JSON structure used by build_customer_deck. "
+            "Supports multi-sheet or single-sheet formats."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "excel_path": {
+                    "type": "string",
+                    "description": "Absolute path to the .xlsx file.",
+                },
+                "output_json_path": {
+                    "type": "string",
+                    "description": (
+                        "Optional path to save the parsed JSON. "
+                        "If omitted, returns JSON in the response only."
+                    ),
                 },
-                "required": ["excel_path"],
             },
+            "required": ["excel_path"],
+        },
+    ),
+
+    Tool(
+        name="create_customer",
+        description=(
+            "Scaffold a new customer configuration directory under configs/. "
+            "Creates config.yaml with sensible defaults and an empty "
+            "requirements.json."
         ),
-
-        Tool(
-            name="create_customer",
-            description=(
-                "Scaffold a new customer configuration directory under configs/. "
-                "Creates config.yaml with sensible defaults and an empty "
-                "requirements.json."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer": {
-                        "type": "string",
-                        "description": "Customer name (used as folder name, e.g. 'acme').",
-                    },
-                    "template_path": {
-                        "type": "string",
-                        "description": "Absolute path to the .pptx or .potx template file.",
-                    },
-                    "deck_title": {
-                        "type": "string",
-                        "description": "Title for the deck (default: 'Dynatrace AI Observability').",
-                    },
-                    "screenshots_dir": {
-                        "type": "string",
-                        "description": "Optional path to a directory containing screenshot images.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer": {
+                    "type": "string",
+                    "description": "Customer name (used as folder name, e.g. 'acme').",
+                },
+                "template_path": {
+                    "type": "string",
+                    "description": "Absolute path to the .pptx or .potx template file.",
+                },
+                "deck_title": {
+                    "type": "string",
+                    "description": "Title for the deck (default: 'Dynatrace AI Observability').",
+                },
+                "screenshots_dir": {
+                    "type": "string",
+                    "description": "Optional path to a directory containing screenshot images.",
                 },
-                "required": ["customer", "template_path"],
             },
-        ),
+            "required": ["customer", "template_path"],
+        },
+    ),
 
-        Tool(
-            name="get_requirements",
-            description=(
-                "Read a customer's requirements.json and return a summary: "
-                "domain names, requirement counts, and coverage statistics."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer": {
-                        "type": "string",
-                        "description": "Customer name matching a folder under configs/.",
-                    },
+    Tool(
+        name="get_requirements",
+        description=(
+            "Read a customer's requirements.json and return a summary: "
+            "domain names, requirement counts, and coverage statistics."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer": {
+                    "type": "string",
+                    "description": "Customer name matching a folder under configs/.",
                 },
-                "required": ["customer"],
             },
-        ),
-    ]
+            "required": ["customer"],
+        },
+    ),
+]
+
+
+# Production bypass: with DT_PPT_SKIP_SCHEMA=1 every tool advertises a
+# bare object schema, so the framework's per-call schema walk is a no-op.
+# Handlers validate the arguments they actually use anyway.
+if os.environ.get("DT_PPT_SKIP_SCHEMA") == "1":
+    _MIN_SCHEMA = {"type": "object"}
+    _TOOLS = [Tool(name=t.name, description=t.description,
+                   inputSchema=_MIN_SCHEMA) for t in _TOOLS]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -261,18 +305,21 @@ async def list_tools() -> list[Tool]:
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     try:
+        # Deck builds and Excel parses are synchronous CPU/file work; run
+        # them off the event loop so other requests on the single stdio
+        # loop aren't blocked for the duration of a build
         if name == "build_deck":
-            return _build_deck_generic(arguments)
+            return await asyncio.to_thread(_build_deck_generic, arguments)
         elif name == "build_customer_deck":
-            return _build_customer_deck(arguments)
+            return await asyncio.to_thread(_build_customer_deck, arguments)
         elif name == "list_customers":
-            return _list_customers()
+            return await asyncio.to_thread(_list_customers)
         elif name == "parse_excel":
-            return _parse_excel(arguments)
+            return await asyncio.to_thread(_parse_excel, arguments)
         elif name == "create_customer":
             return _create_customer(arguments)
         elif name == "get_requirements":
-            return _get_requirements(arguments)
+            return await asyncio.to_thread(_get_requirements, arguments)
         else:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
     except Exception as e:
@@ -292,7 +339,7 @@ def _build_deck_generic(args: dict) -> list[TextContent]:
         return [TextContent(type="text",
                 text=f"❌ Template not found: {template_path}")]
 
-    from dt_ppt_builder.builder import build_generic
+    build_generic, _ = _builder()
     result = build_generic(template_path, slides, output_path, layout_indices)
 
     return [TextContent(type="text",
@@ -313,14 +360,20 @@ def _build_customer_deck(args: dict) -> list[TextContent]:
                 text=f"❌ No config found for '{customer}'. "
                      f"Available: {_customer_names()}")]
 
-    with open(config_path, encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
-
+    base = _load_yaml(config_path)
     overrides = args.get("config_overrides") or {}
-    cfg.update(overrides)
-
-    if args.get("output_path"):
-        cfg["output"] = args["output_path"]
+    output_path = args.get("output_path")
+    if overrides or output_path:
+        # Single preallocated merge; the cached base dict stays untouched.
+        # Drop the image-path cache a previous build stashed on the shared
+        # base — it encodes that build's screenshots_dir/images and would
+        # silently shadow overrides of either
+        cfg = {**base, **overrides}
+        cfg.pop("_image_paths_cache", None)
+        if output_path:
+            cfg["output"] = output_path
+    else:
+        cfg = base
 
     config_dir = os.path.join(CONFIGS_DIR, customer)
     req_path = cfg.get("requirements_file") or "requirements.json"
@@ -332,18 +385,21 @@ def _build_customer_deck(args: dict) -> list[TextContent]:
                 text=f"❌ Requirements file not found: {req_path}\n"
                      f"Use parse_excel to create one from an .xlsx file.")]
 
-    with open(req_path, encoding="utf-8") as f:
-        req_data = json.load(f)
+    req_data = _load_json(req_path)
+    # Counts for the success message, taken while the list is cache-hot
+    # instead of re-walking req_data after the build
+    n_domains = len(req_data)
+    n_reqs, _, _ = _summarize(req_data)
 
-    from dt_ppt_builder.builder import build_and_save
+    _, build_and_save = _builder()
     output = cfg.get("output", os.path.join(config_dir, f"{customer}_deck.pptx"))
     result = build_and_save(cfg, req_data, output)
 
     return [TextContent(type="text",
             text=f"✅ Deck built successfully!\n\n"
                  f"📄 **Output:** {result}\n"
-                 f"📊 **Domains:** {len(req_data)}\n"
-                 f"📋 **Requirements:** {sum(len(d['reqs']) for d in req_data)}")]
+                 f"📊 **Domains:** {n_domains}\n"
+                 f"📋 **Requirements:** {n_reqs}")]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -353,32 +409,47 @@ def _list_customers() -> list[TextContent]:
     if not os.path.isdir(CONFIGS_DIR):
         return [TextContent(type="text", text="No configs/ directory found.")]
 
-    customers = []
-    for entry in sorted(os.listdir(CONFIGS_DIR)):
-        cfg_path = os.path.join(CONFIGS_DIR, entry, "config.yaml")
-        if os.path.isfile(cfg_path):
-            with open(cfg_path, encoding="utf-8") as f:
-                cfg = yaml.safe_load(f)
-            req_path = os.path.join(CONFIGS_DIR, entry, "requirements.json")
-            has_reqs = os.path.isfile(req_path)
-            customers.append({
-                "name": entry,
-                "customer": cfg.get("customer", entry),
-                "deck_title": cfg.get("deck_title", ""),
-                "has_requirements": has_reqs,
-            })
+    # scandir DirEntry objects carry cached type info, halving the stat
+    # calls the listdir + isfile walk needed per customer
+    with os.scandir(CONFIGS_DIR) as it:
+        dirs = sorted((e for e in it if e.is_dir(follow_symlinks=False)),
+                      key=lambda e: e.name)
+
+    def _load_one(entry):
+        # Plain concatenation — entry.path is already normalized, so the
+        # per-component checks os.path.join repeats N times add nothing
+        cfg_path = entry.path + _CFG_SUFFIX
+        if not os.path.isfile(cfg_path):
+            return None
+        cfg = _load_yaml(cfg_path)
+        return {
+            "name": entry.name,
+            "customer": cfg.get("customer", entry.name),
+            "deck_title": cfg.get("deck_title", ""),
+            "has_requirements": os.path.isfile(entry.path + _REQS_SUFFIX),
+        }
+
+    # Cold-cache loads are stat + read + libyaml parse, all GIL-releasing,
+    # so overlapping them across customers is a near-linear win (same
+    # pattern as helpers.prefetch_images)
+    if len(dirs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as ex:
+            results = list(ex.map(_load_one, dirs))
+    else:
+        results = [_load_one(e) for e in dirs]
+    customers = [c for c in results if c is not None]
 
     if not customers:
         return [TextContent(type="text", text="No customer configs found under configs/.")]
 
-    lines = ["**Available Customer Configs:**\n"]
-    for c in customers:
-        status = "✅ Ready" if c["has_requirements"] else "⚠️ No requirements.json"
-        lines.append(
-            f"- **{c['name']}** — {c['customer']} "
-            f"({c['deck_title']}) [{status}]"
-        )
-    return [TextContent(type="text", text="\n".join(lines))]
+    # Generator fed straight to join — one result buffer, no list growth
+    body = "\n".join(
+        f"- **{c['name']}** — {c['customer']} ({c['deck_title']}) "
+        f"[{'✅ Ready' if c['has_requirements'] else '⚠️ No requirements.json'}]"
+        for c in customers)
+    return [TextContent(type="text",
+            text="**Available Customer Configs:**\n\n" + body)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -392,29 +463,32 @@ def _parse_excel(args: dict) -> list[TextContent]:
         return [TextContent(type="text",
                 text=f"❌ Excel file not found: {excel_path}")]
 
-    from dt_ppt_builder.excel_parser import parse_excel, parse_excel_to_json
+    parse_excel = _excel()
 
+    # Parse once and serialize only when saving — the old path round-
+    # tripped the parser's output through a JSON string just to iterate it
+    data = parse_excel(excel_path)
     if output_json:
-        json_str = parse_excel_to_json(excel_path, output_json)
-        data = json.loads(json_str)
-        lines = [f"✅ Parsed and saved to: {output_json}\n"]
+        os.makedirs(os.path.dirname(output_json) or ".", exist_ok=True)
+        with open(output_json, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(data, indent=2,
+                                   ensure_ascii=False).encode("utf-8"))
+        head = f"✅ Parsed and saved to: {output_json}\n"
     else:
-        data = parse_excel(excel_path)
-        lines = ["✅ Parsed successfully (not saved to disk).\n"]
+        head = "✅ Parsed successfully (not saved to disk).\n"
 
-    total_reqs = sum(len(d["reqs"]) for d in data)
-    lines.append(f"**{len(data)} domains, {total_reqs} requirements total**\n")
-    for d in data:
-        reqs = d["reqs"]
-        now     = sum(1 for r in reqs if "✅" in r.get("status", ""))
-        partial = sum(1 for r in reqs if "⚡" in r.get("status", ""))
-        roadmap = sum(1 for r in reqs if "🗺" in r.get("status", ""))
-        lines.append(
-            f"- {d['name']}: {len(reqs)} reqs "
-            f"(✅ {now} · ⚡ {partial} · 🗺 {roadmap})"
-        )
-
-    return [TextContent(type="text", text="\n".join(lines))]
+    total_reqs, _, per_domain = _summarize(data)
+    # Generator fed straight to join — one result buffer, no list growth
+    return [TextContent(type="text", text="\n".join((
+        head,
+        f"**{len(data)} domains, {total_reqs} requirements total**\n",
+        *(f"- {name}: {n} reqs "
+          f"(✅ {now} · ⚡ {partial} · 🗺 {roadmap})"
+          for name, n, (now, partial, roadmap) in per_domain),
+    )))]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -453,12 +527,25 @@ def _create_customer(args: dict) -> list[TextContent]:
     }
 
     cfg_path = os.path.join(cust_dir, "config.yaml")
-    with open(cfg_path, "w", encoding="utf-8") as f:
-        yaml.dump(cfg, f, default_flow_style=False, allow_unicode=True)
+    if os.environ.get("DT_PPT_STRICT_YAML_EMIT") == "1":
+        # Dump to memory first — the emitter issues one write per node,
+        # buffering collapses that to a single syscall
+        import io
+        y, _, dumper = _yaml()
+        buf = io.StringIO()
+        y.dump(cfg, buf, Dumper=dumper, default_flow_style=False,
+               allow_unicode=True)
+        with open(cfg_path, "w", encoding="utf-8") as f:
+            f.write(buf.getvalue())
+    else:
+        # Scaffold schema is fixed, so a template write skips the YAML
+        # emitter; json.dumps yields valid YAML double-quoted scalars
+        with open(cfg_path, "w", encoding="utf-8") as f:
+            f.write(_scaffold_yaml(cfg))
 
     req_path = os.path.join(cust_dir, "requirements.json")
-    with open(req_path, "w", encoding="utf-8") as f:
-        json.dump([], f)
+    with open(req_path, "wb") as f:
+        f.write(b"[]")
 
     return [TextContent(type="text",
             text=f"✅ Customer scaffolded: {cust_dir}\n\n"
@@ -471,6 +558,30 @@ def _create_customer(args: dict) -> list[TextContent]:
                  f"3. Build: use `build_customer_deck` with customer='{customer}'")]
 
 
+def _scaffold_yaml(cfg: dict) -> str:
+    """Serialize the fixed scaffold config without the YAML emitter."""
+    def q(s):   # double-quoted YAML scalar with proper escaping
+        return json.dumps(s, ensure_ascii=False)
+    li = cfg["layout_indices"]
+    return (
+        f'customer: {q(cfg["customer"])}\n'
+        f'deck_title: {q(cfg["deck_title"])}\n'
+        f'deck_subtitle: {q(cfg["deck_subtitle"])}\n'
+        f'contact: {q(cfg["contact"])}\n'
+        f'closing_message: {q(cfg["closing_message"])}\n'
+        f'template: {q(cfg["template"])}\n'
+        f'output: {q(cfg["output"])}\n'
+        'layout_indices:\n'
+        f'  title_center: {li["title_center"]}\n'
+        f'  title_content: {li["title_content"]}\n'
+        f'  two_img: {li["two_img"]}\n'
+        f'screenshots_dir: {q(cfg["screenshots_dir"])}\n'
+        'images: {}\n'
+        'screenshot_slides: []\n'
+        f'requirements_file: {q(cfg["requirements_file"])}\n'
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # get_requirements
 # ─────────────────────────────────────────────────────────────────────────────
@@ -483,50 +594,207 @@ def _get_requirements(args: dict) -> list[TextContent]:
         return [TextContent(type="text",
                 text=f"❌ No requirements.json for '{customer}'")]
 
-    with open(req_path, encoding="utf-8") as f:
-        data = json.load(f)
+    # Only names, counts and tallies survive the scan — the streaming path
+    # holds at most one domain's dicts in memory at a time
+    if ijson is not None:
+        with open(req_path, "rb") as f:
+            total, totals, counts = _summarize(ijson.items(f, "item"))
+    else:
+        total, totals, counts = _summarize(_load_json(req_path))
 
-    if not data:
+    if not counts:
         return [TextContent(type="text",
                 text=f"⚠️ requirements.json for '{customer}' is empty.")]
 
-    total = sum(len(d["reqs"]) for d in data)
-    now     = sum(1 for d in data for r in d["reqs"] if "✅" in r.get("status",""))
-    partial = sum(1 for d in data for r in d["reqs"] if "⚡" in r.get("status",""))
-    roadmap = sum(1 for d in data for r in d["reqs"] if "🗺" in r.get("status",""))
+    now, partial, roadmap = totals
     pct = round(now / total * 100) if total else 0
 
-    lines = [
+    summary = "\n".join((
         f"**{customer.title()} Requirements Summary**\n",
-        f"📊 {total} total requirements across {len(data)} domains",
+        f"📊 {total} total requirements across {len(counts)} domains",
         f"✅ {now} available now ({pct}%)",
         f"⚡ {partial} partially available",
         f"🗺 {roadmap} on roadmap\n",
         "**Domains:**",
-    ]
-
-    for d in data:
-        reqs = d["reqs"]
-        d_now = sum(1 for r in reqs if "✅" in r.get("status",""))
-        d_part = sum(1 for r in reqs if "⚡" in r.get("status",""))
-        d_road = sum(1 for r in reqs if "🗺" in r.get("status",""))
-        lines.append(
-            f"- {d['name']}: {len(reqs)} reqs "
-            f"(✅ {d_now} · ⚡ {d_part} · 🗺 {d_road})"
-        )
-
-    return [TextContent(type="text", text="\n".join(lines))]
+        *(f"- {name}: {n} reqs "
+          f"(✅ {d_now} · ⚡ {d_part} · 🗺 {d_road})"
+          for name, n, (d_now, d_part, d_road) in counts),
+    ))
+    return [TextContent(type="text", text=summary)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Utilities
 # ─────────────────────────────────────────────────────────────────────────────
+# Parsed YAML configs keyed by path, with the (mtime_ns, size) stamp kept
+# in the value for invalidation — an edited config replaces its entry
+# instead of stranding the old parse, so the cache holds one dict per
+# config. Cached dicts are shared; callers that mutate the config must
+# take a copy.
+_YAML_CACHE: dict = {}   # path → ((mtime_ns, size), cfg)
+
+
+# Cached accessors for the heavy dt_ppt_builder imports — the python-pptx
+# module graph loads once on first build instead of re-running importlib
+# lookups inside every tool call
+@functools.cache
+def _builder():
+    from dt_ppt_builder.builder import build_generic, build_and_save
+    return build_generic, build_and_save
+
+
+@functools.cache
+def _excel():
+    from dt_ppt_builder.excel_parser import parse_excel
+    return parse_excel
+
+
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use, preferring the libyaml C bindings.
+
+    Returns (module, loader, dumper); the cache makes later calls a
+    single dict hit.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+_STATUS_KEYS = ("✅", "⚡", "🗺")
+# Statuses lead with their emoji, so a first-char dict hit replaces three
+# substring scans per requirement (same dispatch brand.status_color uses)
+_STATUS_MAP = {k: i for i, k in enumerate(_STATUS_KEYS)}
+
+
+def _tally(reqs) -> list:
+    """Count [now, partial, roadmap] statuses in one pass over reqs."""
+    c = [0, 0, 0]
+    m = _STATUS_MAP.get
+    for r in reqs:
+        s = r.get("status", "")
+        i = m(s[:1])
+        if i is None:   # emoji not leading — rare
+            for j, k in enumerate(_STATUS_KEYS):
+                if k in s:
+                    i = j
+                    break
+            else:
+                continue
+        c[i] += 1
+    return c
+
+
+def _summarize(data):
+    """Single walk over parsed requirements data (any iterable of domain
+    dicts, so the ijson stream feeds it too).
+
+    Returns (grand_total, [now, partial, roadmap], per_domain) where
+    per_domain rows are (name, count, tally) — everything the tool
+    responses report, gathered without re-traversing the structure.
+    """
+    grand = 0
+    totals = [0, 0, 0]
+    per_domain = []
+    for d in data:
+        reqs = d["reqs"]
+        t = _tally(reqs)
+        per_domain.append((d["name"], len(reqs), t))
+        totals[0] += t[0]
+        totals[1] += t[1]
+        totals[2] += t[2]
+        grand += len(reqs)
+    return grand, totals, per_domain
+
+
+_MMAP_MIN = 65536   # below this a plain read is cheaper than a mapping
+
+
+def _slurp(path: str):
+    """File contents as a bytes-like object for the C parsers.
+
+    Large files are mmap'd so the parser reads the page cache directly —
+    no text-mode decode layer and no intermediate copy. Callers close
+    non-bytes results after parsing.
+    """
+    f = open(path, "rb")
+    if os.path.getsize(path) > _MMAP_MIN:
+        import mmap
+        with f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with f:
+        return f.read()
+
+
+def _load_json(path: str):
+    buf = _slurp(path)
+    if isinstance(buf, bytes):
+        return orjson.loads(buf) if orjson is not None else json.loads(buf)
+    try:
+        # orjson reads the mapping through a memoryview without copying;
+        # stdlib json needs a real bytes object
+        if orjson is not None:
+            return orjson.loads(memoryview(buf))
+        return json.loads(bytes(buf))
+    finally:
+        buf.close()
+
+
+def _load_yaml(path: str) -> dict:
+    st = os.stat(path)
+    yaml_mtime = st.st_mtime_ns
+    stamp = (yaml_mtime, st.st_size)
+    entry = _YAML_CACHE.get(path)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    # JSON sidecar written on first parse — C json parsing beats even
+    # libyaml on cold starts; a stale or unreadable sidecar falls back
+    # to the YAML source
+    cfg = None
+    jcache = path + ".cache.json"
+    try:
+        if os.stat(jcache).st_mtime_ns >= yaml_mtime:
+            cfg = _load_json(jcache)
+    except (OSError, ValueError):
+        cfg = None
+    if cfg is None:
+        y, loader, _ = _yaml()
+        buf = _slurp(path)
+        try:
+            cfg = y.load(buf, Loader=loader)
+        finally:
+            if not isinstance(buf, bytes):
+                buf.close()
+        try:
+            with open(jcache, "w", encoding="utf-8") as f:
+                json.dump(cfg, f)
+        except (OSError, TypeError):   # read-only dir / non-JSON value
+            pass
+    _YAML_CACHE[path] = (stamp, cfg)
+    return cfg
+
+
+# Joined name list cached against the directory mtime — adding or removing
+# a customer folder bumps it, which is the only thing that changes the string
+_NAMES_CACHE = {"mtime": -1, "val": ""}
+
+
 def _customer_names() -> str:
-    if not os.path.isdir(CONFIGS_DIR):
+    try:
+        m = os.stat(CONFIGS_DIR).st_mtime_ns
+    except FileNotFoundError:
         return "(none)"
-    names = [e for e in os.listdir(CONFIGS_DIR)
-             if os.path.isdir(os.path.join(CONFIGS_DIR, e))]
-    return ", ".join(names) if names else "(none)"
+    if m == _NAMES_CACHE["mtime"]:
+        return _NAMES_CACHE["val"]
+    names = ", ".join(e.name for e in os.scandir(CONFIGS_DIR)
+                      if e.is_dir(follow_symlinks=False))
+    val = names or "(none)"
+    _NAMES_CACHE["mtime"] = m
+    _NAMES_CACHE["val"] = val
+    return val
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -542,4 +810,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Drop-in libuv loop when installed — lower per-frame overhead on the
+    # stdio transport
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())